@@ -3,23 +3,63 @@ Athenian Digital Academy - Main Entry Point
 数字科学家雅典学院 - 主入口
 """
 
-from .core.agent_layer import AgentLayer, AgentRole
-from .core.interaction_layer import InteractionLayer
-from .core.synthesis_layer import SynthesisLayer
-from .core.critical_rationalism import (
-    CriticalRationalismEngine,
-    ConjectureType,
-    CriticismType
-)
-from .core.knowledge_capsule import (
-    KnowledgeCapsuleSystem,
-    KnowledgeCapsule
-)
+import importlib
+import json
+from datetime import datetime
+from enum import Enum
+
+try:
+    import orjson
+except ImportError:  # orjson 为可选依赖，缺失时退回标准库 json
+    orjson = None
+
+# 公共名称 → 所在子模块；首次访问时才导入（PEP 562）
+_LAZY_ATTRS = {
+    "AgentLayer": ".core.agent_layer",
+    "AgentRole": ".core.agent_layer",
+    "InteractionLayer": ".core.interaction_layer",
+    "SynthesisLayer": ".core.synthesis_layer",
+    "CriticalRationalismEngine": ".core.critical_rationalism",
+    "ConjectureType": ".core.critical_rationalism",
+    "CriticismType": ".core.critical_rationalism",
+    "KnowledgeCapsuleSystem": ".core.knowledge_capsule",
+    "KnowledgeCapsule": ".core.knowledge_capsule",
+}
+
+__all__ = [
+    "AthenianDigitalAcademy",
+    "create_academy",
+    *_LAZY_ATTRS,
+]
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRS))
 
 __version__ = "1.0.0"
 __author__ = "NRT OpenSpider Team"
 
 
+def _json_default(obj):
+    """序列化枚举与时间等非原生JSON类型"""
+    if isinstance(obj, Enum):
+        return obj.value
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    if hasattr(obj, "to_dict"):
+        return obj.to_dict()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
 class AthenianDigitalAcademy:
     """
     Athenian Digital Academy - 数字科学家雅典学院主类
@@ -30,31 +70,70 @@ class AthenianDigitalAcademy:
     def __init__(self, config: dict = None):
         self.config = config or {}
         
-        # 初始化各层
-        self.agent_layer = AgentLayer(config.get("agent"))
-        self.interaction_layer = InteractionLayer(config.get("interaction"))
-        self.synthesis_layer = SynthesisLayer(config.get("synthesis"))
-        self.cr_engine = CriticalRationalismEngine(config.get("critical_rationalism"))
-        self.knowledge_system = KnowledgeCapsuleSystem(config.get("knowledge"))
+        # 各层在首次访问时才构建，见下方属性
+        self._agent_layer = None
+        self._interaction_layer = None
+        self._synthesis_layer = None
+        self._cr_engine = None
+        self._knowledge_system = None
         
         # 初始化状态
         self.initialized = False
         self.running = False
     
+    # ==================== Lazy Layers ====================
+    
+    @property
+    def agent_layer(self):
+        """智能体基础层 (L1-L4)"""
+        if self._agent_layer is None:
+            from .core.agent_layer import AgentLayer
+            self._agent_layer = AgentLayer(self.config.get("agent"))
+        return self._agent_layer
+    
+    @property
+    def interaction_layer(self):
+        """交互范式层 (L5-L6)"""
+        if self._interaction_layer is None:
+            from .core.interaction_layer import InteractionLayer
+            self._interaction_layer = InteractionLayer(self.config.get("interaction"))
+        return self._interaction_layer
+    
+    @property
+    def synthesis_layer(self):
+        """系统层合成 (L7)"""
+        if self._synthesis_layer is None:
+            from .core.synthesis_layer import SynthesisLayer
+            self._synthesis_layer = SynthesisLayer(self.config.get("synthesis"))
+        return self._synthesis_layer
+    
+    @property
+    def cr_engine(self):
+        """批判理性主义引擎"""
+        if self._cr_engine is None:
+            from .core.critical_rationalism import CriticalRationalismEngine
+            self._cr_engine = CriticalRationalismEngine(self.config.get("critical_rationalism"))
+        return self._cr_engine
+    
+    @property
+    def knowledge_system(self):
+        """知识胶囊系统"""
+        if self._knowledge_system is None:
+            from .core.knowledge_capsule import KnowledgeCapsuleSystem
+            self._knowledge_system = KnowledgeCapsuleSystem(self.config.get("knowledge"))
+        return self._knowledge_system
+    
     def initialize(self) -> dict:
         """初始化系统"""
         self.initialized = True
+        snapshot = self.get_status()
         
         return {
             "status": "initialized",
-            "layers": {
-                "agent": self.agent_layer.get_layer_status(),
-                "interaction": self.interaction_layer.get_layer_status(),
-                "synthesis": self.synthesis_layer.get_synthesis_metrics()
-            },
+            "layers": snapshot["layers"],
             "engines": {
-                "critical_rationalism": self.cr_engine.get_cycle_status(),
-                "knowledge_capsule": self.knowledge_system.get_system_status()
+                "critical_rationalism": snapshot["engines"]["critical_rationalism"],
+                "knowledge_capsule": snapshot["engines"]["knowledge"]
             }
         }
     
@@ -69,7 +148,12 @@ class AthenianDigitalAcademy:
         if not self.initialized:
             self.initialize()
         
-        active_roles = [AgentRole(r) for r in (roles or ["strategist", "engineer", "researcher"])]
+        from .core.agent_layer import _ROLE_BY_VALUE
+        
+        active_roles = [
+            _ROLE_BY_VALUE[r] if isinstance(r, str) else r
+            for r in (roles or ["strategist", "engineer", "researcher"])
+        ]
         
         return self.agent_layer.multi_agent_collaborate(task, active_roles)
     
@@ -95,7 +179,6 @@ class AthenianDigitalAcademy:
             tags=tags or [],
             cross_domain_fusion=cross_domain
         )
-        
         return capsule.to_dict()
     
     # ==================== Semantic Collision ====================
@@ -138,20 +221,39 @@ class AthenianDigitalAcademy:
             "safety_check": {"passed": True}
         }
     
+    # ==================== Serialization ====================
+    
+    def to_json(self, result) -> bytes:
+        """
+        将结果序列化为JSON (UTF-8 bytes)
+        
+        安装 orjson 时使用其C实现，枚举与时间字段交由 default 处理
+        """
+        if orjson is not None:
+            return orjson.dumps(result, default=_json_default)
+        return json.dumps(result, default=_json_default, ensure_ascii=False).encode("utf-8")
+    
     # ==================== System Status ====================
     
     def get_status(self) -> dict:
-        """获取系统状态"""
+        """
+        获取系统状态
+        
+        每次调用新建快照：各层计数由层自身（及其脏标记缓存）提供，
+        直接操作 agent_layer 等属性后也能反映最新状态；层返回的缓存字典在此复制，
+        调用方修改快照不会影响各层
+        """
+        cr_status = self.cr_engine.get_cycle_status()
         return {
             "initialized": self.initialized,
             "running": self.running,
             "layers": {
-                "agent": self.agent_layer.get_layer_status(),
+                "agent": dict(self.agent_layer.get_layer_status()),
                 "interaction": self.interaction_layer.get_layer_status(),
                 "synthesis": self.synthesis_layer.get_synthesis_metrics()
             },
             "engines": {
-                "critical_rationalism": self.cr_engine.get_cycle_status(),
+                "critical_rationalism": {**cr_status, "cycle": dict(cr_status["cycle"])},
                 "knowledge": self.knowledge_system.get_system_status()
             }
         }
@@ -167,8 +269,6 @@ def create_academy(config: dict = None) -> AthenianDigitalAcademy:
 # ==================== CLI Entry Point ====================
 
 if __name__ == "__main__":
-    import sys
-    
     print("""
     ===========================================
     Athenian Digital Academy - 数字科学家雅典学院
@@ -186,4 +286,4 @@ if __name__ == "__main__":
     academy = create_academy()
     academy.initialize()
     
-    print(f"\nSystem Status: {academy.get_status()['status']}")
+    print(f"\nSystem Status: {'initialized' if academy.get_status()['initialized'] else 'not initialized'}")
@@ -5,11 +5,16 @@ Athenian Digital Academy - Core Engine
 基于雅典学院7层MAS框架 + 三国数字科学家团队 + 批判理性主义方法论
 """
 
-from .agent_layer import AgentLayer
-from .interaction_layer import InteractionLayer
-from .synthesis_layer import SynthesisLayer
-from .critical_rationalism import CriticalRationalismEngine
-from .knowledge_capsule import KnowledgeCapsuleSystem
+import importlib
+
+# 子模块在首次访问对应名称时才导入（PEP 562）
+_LAZY_ATTRS = {
+    'AgentLayer': '.agent_layer',
+    'InteractionLayer': '.interaction_layer',
+    'SynthesisLayer': '.synthesis_layer',
+    'CriticalRationalismEngine': '.critical_rationalism',
+    'KnowledgeCapsuleSystem': '.knowledge_capsule',
+}
 
 __all__ = [
     'AgentLayer',
@@ -18,3 +23,16 @@ __all__ = [
     'CriticalRationalismEngine',
     'KnowledgeCapsuleSystem'
 ]
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRS))
@@ -0,0 +1,16 @@
+"""
+Refutation Constants
+反驳判定常量
+
+标量路径 (critical_rationalism) 与批量内核 (_cr_numba) 共用：本模块不依赖 numpy/numba，可在导入时直接加载
+"""
+
+
+# 结果编码 → 结果字符串
+RESULT_REFUTED = 0
+RESULT_SURVIVED = 1
+RESULT_MODIFIED = 2
+RESULT_NAMES = ("refuted", "survived", "modified")
+
+# 严重程度超过该阈值且测试通过时，猜想被反驳
+REFUTE_SEVERITY_THRESHOLD = 0.7
@@ -0,0 +1,54 @@
+"""
+Refutation Classification Kernel
+反驳结果分类内核
+
+批量判定反驳结果：安装 numba 时JIT编译（并缓存编译产物），否则退化为纯Python实现
+"""
+
+import numpy as np
+
+from ._cr_constants import (
+    REFUTE_SEVERITY_THRESHOLD,
+    RESULT_MODIFIED,
+    RESULT_REFUTED,
+    RESULT_SURVIVED,
+)
+
+try:
+    from numba import njit
+except ImportError:  # numba 为可选依赖
+    njit = None
+
+
+def _classify_refutations(severities, passed, out):
+    """
+    三路判定反驳结果
+
+    Args:
+        severities: float64 数组，批评的严重程度
+        passed: bool 数组，测试是否通过
+        out: int8 数组，写入结果编码
+    """
+    for i in range(severities.shape[0]):
+        if passed[i]:
+            if severities[i] > REFUTE_SEVERITY_THRESHOLD:
+                out[i] = RESULT_REFUTED  # 严重错误，猜想被反驳
+            else:
+                out[i] = RESULT_MODIFIED  # 需要修正
+        else:
+            out[i] = RESULT_SURVIVED  # 猜想存活
+
+
+if njit is not None:
+    classify_refutations = njit(cache=True)(_classify_refutations)
+else:
+    classify_refutations = _classify_refutations
+
+
+def classify_batch(severities, passed) -> np.ndarray:
+    """批量分类，返回 int8 结果编码数组"""
+    severities = np.asarray(severities, dtype=np.float64)
+    passed = np.asarray(passed, dtype=np.bool_)
+    out = np.empty(severities.shape[0], dtype=np.int8)
+    classify_refutations(severities, passed, out)
+    return out
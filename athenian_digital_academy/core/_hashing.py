@@ -0,0 +1,20 @@
+"""
+Content Fingerprinting
+内容指纹
+
+仅用于缓存键/潜在空间指纹等非安全场景：安装 xxhash 时使用 xxh3_64，否则退回 MD5
+"""
+
+import hashlib
+
+try:
+    import xxhash
+except ImportError:  # xxhash 为可选依赖
+    xxhash = None
+
+
+def fingerprint(text: str) -> str:
+    """计算文本的十六进制指纹"""
+    if xxhash is not None:
+        return xxhash.xxh3_64_hexdigest(text)
+    return hashlib.md5(text.encode()).hexdigest()
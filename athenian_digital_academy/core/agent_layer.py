@@ -9,8 +9,11 @@ L1-L4: Agent Foundations Layer
 - L4: Single-Agent Multi-Capability Avatars (多能力Avatar)
 """
 
-import json
-from typing import Dict, List, Any, Optional
+import itertools
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Deque, Dict, List, Any, Optional
 from dataclasses import dataclass, field
 from enum import Enum
 
@@ -27,13 +30,23 @@ class AgentRole(Enum):
     TACTICIAN = "tactician"        # 谋略家 (贾诩)
 
 
-@dataclass
+# 角色表在模块加载时构建一次，避免每次调用时遍历/校验枚举
+_ALL_ROLES = tuple(AgentRole)
+_ROLE_BY_VALUE = {role.value: role for role in AgentRole}
+
+# 单个智能体记忆的默认容量，超出后自动淘汰最旧记忆
+DEFAULT_MEMORY_CAPACITY = 1024
+
+
+@dataclass(slots=True)
 class AgentContext:
     """智能体上下文"""
     role: AgentRole
-    memory: List[Dict] = field(default_factory=list)
+    memory: Deque[Dict] = field(default_factory=lambda: deque(maxlen=DEFAULT_MEMORY_CAPACITY))
     scene: str = "default"
     tools: List[str] = field(default_factory=list)
+    agent: Any = None                 # 通过 register_agent 注册的执行体
+    context: Optional[Dict] = None    # 通过 soft_context_update 维护的软上下文
     
     def add_memory(self, item: Dict):
         """添加记忆"""
@@ -41,7 +54,7 @@ class AgentContext:
     
     def switch_role(self, new_role: AgentRole):
         """切换角色"""
-        self.memory = []  # 清空记忆，实现角色隔离
+        self.memory.clear()  # 清空记忆，实现角色隔离
     
     def switch_scene(self, new_scene: str):
         """切换场景"""
@@ -64,18 +77,26 @@ class AgentLayer:
         self.agents: Dict[AgentRole, AgentContext] = {}
         self.scenes: Dict[str, Dict] = {}
         self.avatars: Dict[str, Any] = {}
+        # 与各场景 insights 平行的小写文本索引，供跨场景搜索使用
+        self._insight_lower: Dict[str, List[str]] = {}
+        self._status_dirty = True
+        self._cached_status: Optional[Dict] = None
+        # 单调递增的经验序号，用于迁移记录的内部排序
+        self._experience_seq = itertools.count(1)
         self._init_agents()
     
     def _init_agents(self):
         """初始化所有智能体"""
-        for role in AgentRole:
-            self.agents[role] = AgentContext(role=role)
+        capacity = self.config.get("memory_capacity", DEFAULT_MEMORY_CAPACITY)
+        for role in _ALL_ROLES:
+            self.agents[role] = AgentContext(role=role, memory=deque(maxlen=capacity))
     
     # ==================== L1: Multi-Agent Collaboration ====================
     
     def register_agent(self, role: AgentRole, agent: Any):
         """注册智能体"""
         self.agents[role].agent = agent
+        self._status_dirty = True
     
     def multi_agent_collaborate(
         self, 
@@ -93,9 +114,21 @@ class AgentLayer:
             协作结果
         """
         results = {}
+        registered = [
+            (role, agent) for role in roles
+            if (agent := self.agents[role].agent) is not None
+        ]
+        
+        # 各智能体相互独立，且多为I/O密集型调用，使用线程并发执行
+        futures = {}
+        if registered:
+            with ThreadPoolExecutor(max_workers=len(registered)) as executor:
+                for role, agent in registered:
+                    futures[role] = executor.submit(agent.execute, task)
+        
         for role in roles:
-            if hasattr(self.agents[role], 'agent'):
-                results[role.value] = self.agents[role].agent.execute(task)
+            if role in futures:
+                results[role.value] = futures[role].result()
             else:
                 results[role.value] = f"Agent {role.value} not registered"
         
@@ -131,7 +164,7 @@ class AgentLayer:
         
         轻量级上下文更新，保持角色一致性
         """
-        if hasattr(self.agents[role], 'context'):
+        if self.agents[role].context is not None:
             self.agents[role].context.update(context)
         else:
             self.agents[role].context = context
@@ -154,6 +187,31 @@ class AgentLayer:
             "experiences": [],
             "insights": []
         }
+        self._insight_lower[scene_id] = []
+        self._status_dirty = True
+    
+    def add_insight(self, scene_id: str, insight: Any):
+        """向场景添加洞察"""
+        if scene_id not in self.scenes:
+            self.register_scene(scene_id, {})
+        
+        insights = self.scenes[scene_id]["insights"]
+        lowered = self._lowered_insights(scene_id, insights)
+        insights.append(insight)
+        lowered.append(str(insight).lower())
+    
+    def _lowered_insights(self, scene_id: str, insights: List[Any]) -> List[str]:
+        """
+        取场景洞察的小写文本索引
+        
+        场景可能未经 register_scene 创建，或洞察被直接追加到 scenes[id]["insights"]；
+        索引缺失或长度与洞察列表不一致时整体重建
+        """
+        lowered = self._insight_lower.get(scene_id)
+        if lowered is None or len(lowered) != len(insights):
+            lowered = [str(insight).lower() for insight in insights]
+            self._insight_lower[scene_id] = lowered
+        return lowered
     
     def transfer_experience(
         self, 
@@ -173,6 +231,7 @@ class AgentLayer:
             "from_scene": from_scene,
             "to_scene": to_scene,
             "type": experience_type,
+            "seq": next(self._experience_seq),
             "timestamp": self._get_timestamp()
         }
         
@@ -195,16 +254,24 @@ class AgentLayer:
         使用向量数据库进行语义搜索
         """
         results = []
+        if top_k <= 0:
+            return results
+        
+        # 查询只归一化一次；存储侧已预先小写化
+        query_lower = query.lower()
         for scene_id, scene_data in self.scenes.items():
-            for insight in scene_data.get("insights", []):
-                if query.lower() in str(insight).lower():
+            insights = scene_data.get("insights", [])
+            for insight, insight_lower in zip(insights, self._lowered_insights(scene_id, insights)):
+                if query_lower in insight_lower:
                     results.append({
                         "scene": scene_id,
                         "insight": insight,
                         "relevance": 1.0
                     })
+                    if len(results) >= top_k:
+                        return results
         
-        return results[:top_k]
+        return results
     
     def _calculate_transfer_rate(self, from_scene: str, to_scene: str) -> float:
         """计算迁移成功率"""
@@ -220,6 +287,7 @@ class AgentLayer:
             "capabilities": [],
             "status": "active"
         }
+        self._status_dirty = True
     
     def delegate_to_avatar(
         self, 
@@ -259,16 +327,18 @@ class AgentLayer:
     # ==================== Utility Methods ====================
     
     def _get_timestamp(self) -> str:
-        """获取时间戳"""
-        from datetime import datetime
+        """获取时间戳（ISO格式，用于对外输出）"""
         return datetime.now().isoformat()
     
     def get_layer_status(self) -> Dict:
-        """获取层状态"""
-        return {
-            "layer": "Agent Foundations (L1-L4)",
-            "agents_registered": len(self.agents),
-            "scenes_registered": len(self.scenes),
-            "avatars_registered": len(self.avatars),
-            "status": "active"
-        }
+        """获取层状态（无变更时复用缓存）"""
+        if self._status_dirty or self._cached_status is None:
+            self._cached_status = {
+                "layer": "Agent Foundations (L1-L4)",
+                "agents_registered": len(self.agents),
+                "scenes_registered": len(self.scenes),
+                "avatars_registered": len(self.avatars),
+                "status": "active"
+            }
+            self._status_dirty = False
+        return self._cached_status
@@ -15,9 +15,13 @@ Critical Rationalism Engine
 from typing import Dict, List, Any, Optional
 from dataclasses import dataclass, field
 from enum import Enum
-import json
+from collections import defaultdict
+from operator import attrgetter
+import itertools
 from datetime import datetime
 
+from ._cr_constants import REFUTE_SEVERITY_THRESHOLD, RESULT_NAMES
+
 
 class ConjectureType(Enum):
     """猜想类型"""
@@ -37,7 +41,20 @@ class CriticismType(Enum):
     PEER = "peer"                      # 同侪批评
 
 
-@dataclass
+# 系统性批评模板：(批评类型, 内容, 严重程度)
+_SYSTEMATIC_TEMPLATES = (
+    # 1. 逻辑一致性批评
+    (CriticismType.LOGICAL, "检查逻辑一致性：猜想内部是否存在矛盾？", 0.3),
+    # 2. 经验可检验性批评
+    (CriticismType.EMPIRICAL, "检查经验可检验性：猜想是否可被证伪？", 0.5),
+    # 3. 实践可行性批评
+    (CriticismType.PRACTICAL, "检查实践可行性：猜想在现实中是否可行？", 0.4),
+    # 4. 伦理合规性批评
+    (CriticismType.ETHICAL, "检查伦理合规性：猜想是否符合伦理规范？", 0.6),
+)
+
+
+@dataclass(slots=True)
 class Conjecture:
     """猜想"""
     id: str
@@ -47,20 +64,15 @@ class Conjecture:
     timestamp: str = field(default_factory=lambda: datetime.now().isoformat())
     evidence: List[Dict] = field(default_factory=list)
     proposer: str = "anonymous"
+    status: str = "proposed"  # "proposed", "refined", "refuted"
     
     def to_dict(self) -> Dict:
-        return {
-            "id": self.id,
-            "content": self.content,
-            "type": self.conjecture_type.value,
-            "domain": self.domain,
-            "timestamp": self.timestamp,
-            "evidence": self.evidence,
-            "proposer": self.proposer
-        }
+        data = dict(zip(_CONJECTURE_KEYS, _conjecture_values(self)))
+        data["type"] = data["type"].value
+        return data
 
 
-@dataclass
+@dataclass(slots=True)
 class Criticism:
     """批评"""
     id: str
@@ -73,21 +85,14 @@ class Criticism:
     refutation_attempt: bool = False
     
     def to_dict(self) -> Dict:
-        return {
-            "id": self.id,
-            "conjecture_id": self.conjecture_id,
-            "type": self.criticism_type.value,
-            "content": self.content,
-            "severity": self.severity,
-            "critic": self.critic,
-            "timestamp": self.timestamp,
-            "refutation_attempt": self.refutation_attempt
-        }
+        data = dict(zip(_CRITICISM_KEYS, _criticism_values(self)))
+        data["type"] = data["type"].value
+        return data
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Refutation:
-    """反驳"""
+    """反驳（创建后只读）"""
     id: str
     conjecture_id: str
     criticism_id: str
@@ -96,14 +101,26 @@ class Refutation:
     explanation: str
     
     def to_dict(self) -> Dict:
-        return {
-            "id": self.id,
-            "conjecture_id": self.conjecture_id,
-            "criticism_id": self.criticism_id,
-            "result": self.result,
-            "evidence": self.evidence,
-            "explanation": self.explanation
-        }
+        return dict(zip(_REFUTATION_KEYS, _refutation_values(self)))
+
+
+# 序列化字段表：输出键与属性取值器在模块加载时绑定一次
+_CONJECTURE_KEYS = ("id", "content", "type", "domain", "timestamp", "evidence", "proposer")
+_conjecture_values = attrgetter(
+    "id", "content", "conjecture_type", "domain", "timestamp", "evidence", "proposer"
+)
+
+_CRITICISM_KEYS = (
+    "id", "conjecture_id", "type", "content", "severity",
+    "critic", "timestamp", "refutation_attempt"
+)
+_criticism_values = attrgetter(
+    "id", "conjecture_id", "criticism_type", "content", "severity",
+    "critic", "timestamp", "refutation_attempt"
+)
+
+_REFUTATION_KEYS = ("id", "conjecture_id", "criticism_id", "result", "evidence", "explanation")
+_refutation_values = attrgetter(*_REFUTATION_KEYS)
 
 
 class CriticalRationalismEngine:
@@ -118,7 +135,14 @@ class CriticalRationalismEngine:
         self.conjectures: Dict[str, Conjecture] = {}
         self.criticisms: Dict[str, Criticism] = {}
         self.refutations: Dict[str, Refutation] = {}
-        self._id_counter = 0
+        # 按猜想ID建立的二级索引，避免全表扫描
+        self._criticisms_by_conj: Dict[str, List[Criticism]] = defaultdict(list)
+        self._refutations_by_conj: Dict[str, List[Refutation]] = defaultdict(list)
+        self._conj_by_domain: Dict[str, List[str]] = defaultdict(list)
+        # 全局共享的ID序列：next() 自增且无需格式化器
+        self._id_iter = itertools.count(1)
+        self._status_dirty = True
+        self._cached_status: Optional[Dict] = None
     
     # ==================== Conjecture Phase ====================
     
@@ -135,8 +159,7 @@ class CriticalRationalismEngine:
         
         猜想 = 对问题的尝试性回答
         """
-        self._id_counter += 1
-        conjecture_id = f"conj_{self._id_counter}"
+        conjecture_id = "conj_" + str(next(self._id_iter))
         
         conjecture = Conjecture(
             id=conjecture_id,
@@ -148,6 +171,8 @@ class CriticalRationalismEngine:
         )
         
         self.conjectures[conjecture_id] = conjecture
+        self._conj_by_domain[domain].append(conjecture_id)
+        self._status_dirty = True
         
         return conjecture
     
@@ -157,10 +182,9 @@ class CriticalRationalismEngine:
     
     def list_conjectures(self, domain: str = None) -> List[Conjecture]:
         """列出猜想"""
-        conjectures = list(self.conjectures.values())
         if domain:
-            conjectures = [c for c in conjectures if c.domain == domain]
-        return conjectures
+            return [self.conjectures[cid] for cid in self._conj_by_domain.get(domain, ())]
+        return list(self.conjectures.values())
     
     # ==================== Criticism Phase ====================
     
@@ -180,8 +204,7 @@ class CriticalRationalismEngine:
         if conjecture_id not in self.conjectures:
             raise ValueError(f"Conjecture {conjecture_id} not found")
         
-        self._id_counter += 1
-        criticism_id = f"crit_{self._id_counter}"
+        criticism_id = "crit_" + str(next(self._id_iter))
         
         criticism = Criticism(
             id=criticism_id,
@@ -193,6 +216,8 @@ class CriticalRationalismEngine:
         )
         
         self.criticisms[criticism_id] = criticism
+        self._criticisms_by_conj[conjecture_id].append(criticism)
+        self._status_dirty = True
         
         return criticism
     
@@ -211,45 +236,27 @@ class CriticalRationalismEngine:
             return []
         
         criticisms = []
-        
-        # 1. 逻辑一致性批评
-        criticisms.append(self.add_criticism(
-            conjecture_id=conjecture_id,
-            criticism_type=CriticismType.LOGICAL,
-            content="检查逻辑一致性：猜想内部是否存在矛盾？",
-            severity=0.3,
-            critic=critic
-        ))
-        
-        # 2. 经验可检验性批评
-        criticisms.append(self.add_criticism(
-            conjecture_id=conjecture_id,
-            criticism_type=CriticismType.EMPIRICAL,
-            content="检查经验可检验性：猜想是否可被证伪？",
-            severity=0.5,
-            critic=critic
-        ))
-        
-        # 3. 实践可行性批评
-        criticisms.append(self.add_criticism(
-            conjecture_id=conjecture_id,
-            criticism_type=CriticismType.PRACTICAL,
-            content="检查实践可行性：猜想在现实中是否可行？",
-            severity=0.4,
-            critic=critic
-        ))
-        
-        # 4. 伦理合规性批评
-        criticisms.append(self.add_criticism(
-            conjecture_id=conjecture_id,
-            criticism_type=CriticismType.ETHICAL,
-            content="检查伦理合规性：猜想是否符合伦理规范？",
-            severity=0.6,
-            critic=critic
-        ))
+        for criticism_type, content, severity in _SYSTEMATIC_TEMPLATES:
+            criticisms.append(Criticism(
+                id="crit_" + str(next(self._id_iter)),
+                conjecture_id=conjecture_id,
+                criticism_type=criticism_type,
+                content=content,
+                severity=severity,
+                critic=critic
+            ))
+        
+        # 一次性写入批评表与索引
+        self.criticisms.update((c.id, c) for c in criticisms)
+        self._criticisms_by_conj[conjecture_id].extend(criticisms)
+        self._status_dirty = True
         
         return criticisms
     
+    def list_criticisms(self, conjecture_id: str) -> List[Criticism]:
+        """列出针对某猜想的批评"""
+        return list(self._criticisms_by_conj.get(conjecture_id, []))
+    
     # ==================== Refutation Phase ====================
     
     def attempt_refutation(
@@ -270,15 +277,29 @@ class CriticalRationalismEngine:
         if criticism_id not in self.criticisms:
             raise ValueError(f"Criticism {criticism_id} not found")
         
-        self._id_counter += 1
-        refutation_id = f"ref_{self._id_counter}"
+        return self._attempt_refutation_fast(
+            self.conjectures[conjecture_id],
+            self.criticisms[criticism_id],
+            test_result,
+            explanation
+        )
+    
+    def _attempt_refutation_fast(
+        self,
+        conjecture: Conjecture,
+        criticism: Criticism,
+        test_result: Dict,
+        explanation: str
+    ) -> Refutation:
+        """尝试反驳（内部快速路径：调用方已持有并校验过猜想与批评）"""
+        refutation_id = "ref_" + str(next(self._id_iter))
         
         # 判断反驳结果
-.criticisms[        severity = selfcriticism_id].severity
+        severity = criticism.severity
         test_passed = test_result.get("passed", False)
         
         if test_passed:
-            if severity > 0.7:
+            if severity > REFUTE_SEVERITY_THRESHOLD:
                 result = "refuted"  # 严重错误，猜想被反驳
             else:
                 result = "modified"  # 需要修正
@@ -287,17 +308,70 @@ class CriticalRationalismEngine:
         
         refutation = Refutation(
             id=refutation_id,
-            conjecture_id=conjecture_id,
-            criticism_id=criticism_id,
+            conjecture_id=conjecture.id,
+            criticism_id=criticism.id,
             result=result,
             evidence=test_result,
             explanation=explanation
         )
         
         self.refutations[refutation_id] = refutation
+        self._refutations_by_conj[conjecture.id].append(refutation)
+        self._status_dirty = True
         
         return refutation
     
+    def batch_attempt_refutation(
+        self,
+        pairs: List[tuple],
+        test_results: List[Dict],
+        explanation: str = "批量测试"
+    ) -> List[Refutation]:
+        """
+        批量尝试反驳
+        
+        适用于大规模假设筛选：结果判定交由向量化内核（可选numba JIT）完成
+        
+        Args:
+            pairs: (conjecture_id, criticism_id) 列表
+            test_results: 与 pairs 一一对应的测试结果
+            explanation: 反驳说明
+        """
+        if len(pairs) != len(test_results):
+            raise ValueError("pairs and test_results must have the same length")
+        
+        for conjecture_id, criticism_id in pairs:
+            if conjecture_id not in self.conjectures:
+                raise ValueError(f"Conjecture {conjecture_id} not found")
+            if criticism_id not in self.criticisms:
+                raise ValueError(f"Criticism {criticism_id} not found")
+        
+        # 延迟导入：仅批量路径需要 numpy/numba
+        from ._cr_numba import classify_batch
+        
+        codes = classify_batch(
+            [self.criticisms[criticism_id].severity for _, criticism_id in pairs],
+            [test_result.get("passed", False) for test_result in test_results]
+        )
+        
+        refutations = []
+        for (conjecture_id, criticism_id), test_result, code in zip(pairs, test_results, codes.tolist()):
+            refutation = Refutation(
+                id="ref_" + str(next(self._id_iter)),
+                conjecture_id=conjecture_id,
+                criticism_id=criticism_id,
+                result=RESULT_NAMES[code],
+                evidence=test_result,
+                explanation=explanation
+            )
+            self.refutations[refutation.id] = refutation
+            self._refutations_by_conj[conjecture_id].append(refutation)
+            refutations.append(refutation)
+        
+        self._status_dirty = True
+        
+        return refutations
+    
     # ==================== Error Elimination ====================
     
     def eliminate_errors(self, conjecture_id: str) -> Dict:
@@ -310,7 +384,7 @@ class CriticalRationalismEngine:
         if not conjecture:
             return {"error": "Conjecture not found"}
         
-        refutations = [r for r in self.refutations.values() if r.conjecture_id == conjecture_id]
+        refutations = self._refutations_by_conj.get(conjecture_id, [])
         
         survived = [r for r in refutations if r.result == "survived"]
         refuted = [r for r in refutations if r.result == "refuted"]
@@ -361,17 +435,20 @@ class CriticalRationalismEngine:
     # ==================== Cycle Visualization ====================
     
     def get_cycle_status(self) -> Dict:
-        """获取循环状态"""
-        return {
-            "status": "active",
-            "conjectures": len(self.conjectures),
-            "criticisms": len(self.criticisms),
-            "refutations": len(self.refutations),
-            "cycle": {
-                "phase": "Conjecture → Criticism → Refutation → Error Elimination → New Conjecture",
-                "progress": f"{len(self.conjectures)} → {len(self.criticisms)} → {len(self.refutations)}"
+        """获取循环状态（无变更时复用缓存）"""
+        if self._status_dirty or self._cached_status is None:
+            self._cached_status = {
+                "status": "active",
+                "conjectures": len(self.conjectures),
+                "criticisms": len(self.criticisms),
+                "refutations": len(self.refutations),
+                "cycle": {
+                    "phase": "Conjecture → Criticism → Refutation → Error Elimination → New Conjecture",
+                    "progress": f"{len(self.conjectures)} → {len(self.criticisms)} → {len(self.refutations)}"
+                }
             }
-        }
+            self._status_dirty = False
+        return self._cached_status
     
     def run_full_cycle(
         self,
@@ -399,11 +476,11 @@ class CriticalRationalismEngine:
         for criticism in criticisms:
             # 模拟测试
             test_result = {"passed": True}  # 简化：假设测试通过
-            refutation = self.attempt_refutation(
-                conjecture_id=conjecture.id,
-                criticism_id=criticism.id,
-                test_result=test_result,
-                explanation="测试通过"
+            refutation = self._attempt_refutation_fast(
+                conjecture,
+                criticism,
+                test_result,
+                "测试通过"
             )
             refutations.append(refutation)
         
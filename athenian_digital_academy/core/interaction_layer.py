@@ -7,12 +7,42 @@ L5-L6: Interaction Paradigms Layer
 - L6: Single-Agent Leveraging Multiple Large Models (多模型路由)
 """
 
-from typing import Dict, List, Any, Optional
-from dataclasses import dataclass
-import hashlib
+from typing import Dict, List, Any, Optional, Tuple
+from collections import OrderedDict
+from collections.abc import MutableMapping
+from types import MappingProxyType
+from dataclasses import dataclass, field
 
+import numpy as np
 
-@dataclass
+from ._hashing import fingerprint
+from ._routing_numba import score_kernel, warm_up as _warm_up_score_kernel
+
+
+# 能力词表：每种能力占一个固定比特位（只读，运行期不扩展）
+_CAP_BITS = MappingProxyType({
+    "reasoning": 1,
+    "coding": 2,
+    "analysis": 4,
+    "writing": 8,
+    "vision": 16,
+    "general": 32
+})
+
+
+def _capability_mask(capabilities) -> int:
+    """
+    将能力列表编码为比特掩码
+    
+    任务所需掩码只由词表内的能力组成，未登记的能力不参与匹配，故不占比特位
+    """
+    mask = 0
+    for cap in capabilities:
+        mask |= _CAP_BITS.get(cap, 0)
+    return mask
+
+
+@dataclass(slots=True)
 class ModelConfig:
     """模型配置"""
     model_id: str
@@ -21,15 +51,187 @@ class ModelConfig:
     capabilities: List[str]
     cost_per_token: float
     latency_ms: float
+    capability_mask: int = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        self.capability_mask = _capability_mask(self.capabilities)
+    
+    def to_dict(self) -> Dict:
+        return {
+            "model_id": self.model_id,
+            "model_type": self.model_type,
+            "api_endpoint": self.api_endpoint,
+            "capabilities": list(self.capabilities),
+            "cost_per_token": self.cost_per_token,
+            "latency_ms": self.latency_ms
+        }
+
+
+class _ModelTable(dict):
+    """
+    模型表
+    
+    普通dict子类，任何写操作都递增 version；路由层据此判断SoA视图与路由缓存是否过期，
+    调用方直接增删 layer.models 的条目同样生效
+    """
+    __slots__ = ("version",)
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.version = 0
+    
+    def __reduce__(self):
+        # 复制/序列化时先整体构造再恢复版本号，避免重建条目时访问尚未设置的 version
+        return (type(self), (dict(self),), self.version)
+    
+    def __setstate__(self, version):
+        self.version = version
+    
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self.version += 1
+    
+    def __delitem__(self, key):
+        super().__delitem__(key)
+        self.version += 1
+    
+    def __ior__(self, other):
+        self.update(other)
+        return self
+    
+    def pop(self, *args):
+        self.version += 1
+        return super().pop(*args)
+    
+    def popitem(self):
+        self.version += 1
+        return super().popitem()
+    
+    def setdefault(self, key, default=None):
+        self.version += 1
+        return super().setdefault(key, default)
+    
+    def update(self, *args, **kwargs):
+        super().update(*args, **kwargs)
+        self.version += 1
+    
+    def clear(self):
+        super().clear()
+        self.version += 1
+
+
+# 任务类型 → 所需能力掩码
+_TASK_CAP_MASKS = {
+    "reasoning": _capability_mask(["reasoning"]),
+    "coding": _capability_mask(["coding"]),
+    "analysis": _capability_mask(["analysis"]),
+    "writing": _capability_mask(["writing"]),
+    "vision": _capability_mask(["vision"]),
+    "general": _capability_mask(["reasoning", "analysis"])
+}
+_DEFAULT_CAP_MASK = _capability_mask(["general"])
+
+# 基于雅典学院论文：共享模型架构的信息传递率为98%
+_INFO_FLOW_RATE = 0.98
+
+# 输出凝聚力评分（基于论文数据）
+_COHESION_SCORES = MappingProxyType({
+    "cohesion_score": 0.98,
+    "stylistic_consistency": 0.95,
+    "thematic_consistency": 0.97
+})
+
+
+_BLACKBOARD_PREFIX = "bb:"
+_LATENT_PREFIX = "ls:"
+
+
+class _NamespaceView(MutableMapping):
+    """状态表中某一命名空间的读写视图：键自动加/去前缀，写入直接落到状态表"""
+    __slots__ = ("_state", "_prefix")
+    
+    def __init__(self, state: Dict[str, Any], prefix: str):
+        self._state = state
+        self._prefix = prefix
+    
+    def __getitem__(self, key: str) -> Any:
+        return self._state[self._prefix + key]
+    
+    def __setitem__(self, key: str, value: Any):
+        self._state[self._prefix + key] = value
+    
+    def __delitem__(self, key: str):
+        del self._state[self._prefix + key]
+    
+    def __iter__(self):
+        prefix = self._prefix
+        n = len(prefix)
+        # 先取快照，迭代期间写入视图不会触发字典大小变化错误
+        return iter([k[n:] for k in self._state if k.startswith(prefix)])
+    
+    def __len__(self) -> int:
+        prefix = self._prefix
+        return sum(1 for k in self._state if k.startswith(prefix))
+    
+    def __repr__(self) -> str:
+        return repr(dict(self))
 
 
-@dataclass
+@dataclass(slots=True, init=False)
 class SharedContext:
-    """共享上下文"""
+    """
+    共享上下文
+    
+    黑板与潜在空间共用一张扁平状态表，以命名空间前缀区分：
+    "bb:<key>" 为黑板条目，"ls:<participant>" 为潜在空间条目。
+    构造参数与 blackboard / latent_space 属性保持原有形式，属性为写穿透视图
+    """
     session_id: str
-    latent_space: Dict[str, Any]
-    blackboard: Dict[str, Any]
     participants: List[str]
+    state: Dict[str, Any]
+    
+    def __init__(
+        self,
+        session_id: str,
+        latent_space: Dict[str, Any] = None,
+        blackboard: Dict[str, Any] = None,
+        participants: List[str] = None
+    ):
+        self.session_id = session_id
+        self.participants = participants if participants is not None else []
+        self.state = {}
+        if latent_space:
+            self.latent_space = latent_space
+        if blackboard:
+            self.blackboard = blackboard
+    
+    @property
+    def blackboard(self) -> MutableMapping:
+        """黑板视图（读写直接作用于状态表）"""
+        return _NamespaceView(self.state, _BLACKBOARD_PREFIX)
+    
+    @blackboard.setter
+    def blackboard(self, entries: Dict[str, Any]):
+        self._replace_namespace(_BLACKBOARD_PREFIX, entries)
+    
+    @property
+    def latent_space(self) -> MutableMapping:
+        """潜在空间视图（读写直接作用于状态表）"""
+        return _NamespaceView(self.state, _LATENT_PREFIX)
+    
+    @latent_space.setter
+    def latent_space(self, entries: Dict[str, Any]):
+        self._replace_namespace(_LATENT_PREFIX, entries)
+    
+    def _replace_namespace(self, prefix: str, entries: Dict[str, Any]):
+        """整体替换某一命名空间的条目"""
+        # 先复制新条目：entries 可能正是本命名空间的视图
+        items = list(entries.items())
+        state = self.state
+        for k in [k for k in state if k.startswith(prefix)]:
+            del state[k]
+        for key, value in items:
+            state[prefix + key] = value
 
 
 class InteractionLayer:
@@ -43,10 +245,23 @@ class InteractionLayer:
     
     def __init__(self, config: Dict[str, Any] = None):
         self.config = config or {}
-        self.models: Dict[str, ModelConfig] = {}
+        self._models = _ModelTable()
         self.sessions: Dict[str, SharedContext] = {}
         self.router_rules: List[Dict] = []
+        # 有界LRU缓存，只存不可变的中间结果，返回值每次新建：
+        # 执行缓存 prompt → 指纹；路由缓存 → (模型表版本, 选中模型, 评分)，随模型表版本失效
+        self._cache_size = self.config.get("cache_size", 4096)
+        self._route_cache: OrderedDict = OrderedDict()
+        self._exec_cache: OrderedDict = OrderedDict()
+        # 模型表的SoA视图（并行数组）；_soa_version 与模型表版本不一致时按需重建
+        self._model_ids: List[str] = []
+        self._model_pos: Dict[str, int] = {}
+        self._cost = np.empty(0)
+        self._latency = np.empty(0)
+        self._cap_masks = np.empty(0, dtype=np.uint64)
+        self._soa_version = -1
         self._init_default_models()
+        _warm_up_score_kernel()
     
     def _init_default_models(self):
         """初始化默认模型"""
@@ -78,7 +293,55 @@ class InteractionLayer:
         ]
         
         for model in default_models:
-            self.models[model.model_id] = model
+            self.register_model(model)
+    
+    @property
+    def models(self) -> Dict[str, ModelConfig]:
+        """已注册模型表 model_id → ModelConfig（可直接增删，路由视图自动失效）"""
+        return self._models
+    
+    @models.setter
+    def models(self, models: Dict[str, ModelConfig]):
+        # 整表替换时版本号继续递增，旧版本的缓存条目不会被误用
+        version = self._models.version + 1
+        self._models = _ModelTable(models)
+        self._models.version = version
+    
+    def register_model(self, model: ModelConfig):
+        """注册模型"""
+        self._models[model.model_id] = model
+    
+    def remove_model(self, model_id: str) -> bool:
+        """移除模型"""
+        if model_id not in self._models:
+            return False
+        del self._models[model_id]
+        return True
+    
+    def _rebuild_soa(self):
+        """按当前模型表重建SoA视图，并清空已过期的路由缓存"""
+        models = list(self._models.values())
+        self._model_ids = [m.model_id for m in models]
+        self._model_pos = {model_id: i for i, model_id in enumerate(self._model_ids)}
+        self._cost = np.array([m.cost_per_token for m in models], dtype=np.float64)
+        self._latency = np.array([m.latency_ms for m in models], dtype=np.float64)
+        self._cap_masks = np.array([m.capability_mask for m in models], dtype=np.uint64)
+        
+        self._route_cache.clear()
+        self._soa_version = self._models.version
+    
+    def _cache_get(self, cache: OrderedDict, key) -> Optional[Any]:
+        """读取LRU缓存"""
+        entry = cache.get(key)
+        if entry is not None:
+            cache.move_to_end(key)
+        return entry
+    
+    def _cache_put(self, cache: OrderedDict, key, entry: Any):
+        """写入LRU缓存，超出容量时淘汰最久未使用项"""
+        cache[key] = entry
+        if len(cache) > self._cache_size:
+            cache.popitem(last=False)
     
     # ==================== L5: Shared LLM Collaboration ====================
     
@@ -94,8 +357,6 @@ class InteractionLayer:
         """
         session = SharedContext(
             session_id=session_id,
-            latent_space={},
-            blackboard={},
             participants=participants
         )
         self.sessions[session_id] = session
@@ -115,15 +376,12 @@ class InteractionLayer:
         if session_id not in self.sessions:
             return {"error": f"Session {session_id} not found"}
         
-        self.sessions[session_id].blackboard[key] = value
-        
-        # 计算信息传递率
-        info_flow = self._calculate_info_flow(session_id)
+        self.sessions[session_id].state[_BLACKBOARD_PREFIX + key] = value
         
         return {
             "status": "written",
             "key": key,
-            "info_flow_rate": info_flow,
+            "info_flow_rate": _INFO_FLOW_RATE,
             "session": session_id
         }
     
@@ -135,7 +393,7 @@ class InteractionLayer:
         """从黑板读取"""
         if session_id not in self.sessions:
             return None
-        return self.sessions[session_id].blackboard.get(key)
+        return self.sessions[session_id].state.get(_BLACKBOARD_PREFIX + key)
     
     def shared_model_execute(
         self, 
@@ -151,13 +409,19 @@ class InteractionLayer:
         if session_id not in self.sessions:
             return {"error": f"Session {session_id} not found"}
         
+        # 指纹只取决于 prompt，按 prompt 缓存；潜在空间写入等副作用每次照常执行
+        prompt_hash = self._cache_get(self._exec_cache, prompt)
+        if prompt_hash is None:
+            prompt_hash = fingerprint(prompt)
+            self._cache_put(self._exec_cache, prompt, prompt_hash)
+        
         # 使用共享模型
         model = self.models.get("gpt-4")
         
         # 更新潜在空间
-        self.sessions[session_id].latent_space[participant] = {
+        self.sessions[session_id].state[_LATENT_PREFIX + participant] = {
             "input": prompt,
-            "hash": hashlib.md5(prompt.encode()).hexdigest()
+            "hash": prompt_hash
         }
         
         return {
@@ -168,19 +432,28 @@ class InteractionLayer:
             "model": model.model_id if model else "unknown"
         }
     
-    def _calculate_info_flow(self, session_id: str) -> float:
-        """计算信息传递率"""
-        # 基于雅典学院论文：共享模型架构的信息传递率为98%
-        return 0.98
+    def shared_model_execute_batch(
+        self,
+        session_id: str,
+        requests: List[Tuple[str, str]]
+    ) -> List[Dict]:
+        """
+        批量共享模型执行
+        
+        模型调用为本地同步计算，按顺序逐个执行，结果顺序与 requests 一致
+        
+        Args:
+            session_id: 会话ID
+            requests: (participant, prompt) 列表
+        """
+        return [
+            self.shared_model_execute(session_id, prompt, participant)
+            for participant, prompt in requests
+        ]
     
     def check_output_cohesion(self, session_id: str) -> Dict:
         """检查输出凝聚力"""
-        return {
-            "session": session_id,
-            "cohesion_score": 0.98,  # 98% - 基于论文数据
-            "stylistic_consistency": 0.95,
-            "thematic_consistency": 0.97
-        }
+        return {"session": session_id, **_COHESION_SCORES}
     
     # ==================== L6: Multi-Model Leveraging ====================
     
@@ -198,86 +471,95 @@ class InteractionLayer:
         
         实现L6核心机制：基于成本效益分析选择最佳模型
         """
-        models = available_models or list(self.models.keys())
+        task_type = task.get("type", "general")
+        key = (task_type, task.get("priority", "normal"),
+               tuple(available_models) if available_models else None)
+        version = self._models.version
+        cached = self._cache_get(self._route_cache, key)
+        if cached is not None and cached[0] == version:
+            result = self._route_result(task_type, cached[1], cached[2])
+            if result is not None:
+                return result
         
-        best_model = None
-        best_score = float('-inf')
+        if self._soa_version != version:
+            self._rebuild_soa()
         
-        for model_id in models:
-            if model_id not in self.models:
-                continue
-            
-            model = self.models[model_id]
-            score = self._calculate_routing_score(task, model)
-            
-            if score > best_score:
-                best_score = score
-                best_model = model_id
+        # 候选模型在SoA中的下标，保持调用方给出的顺序（同分时取靠前者）
+        if available_models:
+            candidates = [self._model_pos[m] for m in available_models if m in self._model_pos]
+        else:
+            candidates = list(range(len(self._model_ids)))
         
-        if best_model is None:
+        if not candidates:
             return {"error": "No suitable model found"}
         
-        # 返回路由决策
+        scores = self._score_models(task)[candidates]
+        best = int(scores.argmax())
+        best_model = self._model_ids[candidates[best]]
+        best_score = float(scores[best])
+        
+        self._cache_put(self._route_cache, key, (version, best_model, best_score))
+        
+        return self._route_result(task_type, best_model, best_score)
+    
+    def _route_result(self, task_type: str, best_model: str, best_score: float) -> Optional[Dict]:
+        """构造路由决策；best_model 已不在模型表中时返回 None，由调用方重新评分"""
+        model = self._models.get(best_model)
+        if model is None:
+            return None
         return {
-            "task": task.get("type", "general"),
+            "task": task_type,
             "selected_model": best_model,
-            "model_config": self.models[best_model].__dict__,
+            "model_config": model.to_dict(),
             "confidence": best_score,
-            "routing_reason": self._get_routing_reason(task, best_model)
+            "routing_reason": f"Selected {best_model} for {task_type} task"
         }
     
-    def _calculate_routing_score(self, task: Dict, model: ModelConfig) -> float:
+    def intelligent_route_batch(
+        self,
+        tasks: List[Dict],
+        available_models: List[str] = None
+    ) -> List[Dict]:
         """
-        计算路由评分
+        批量智能路由
         
-        考虑因素：
-        - 任务需求匹配度
-        - API成本
-        - 延迟要求
+        逐个路由，相同任务命中路由缓存；结果顺序与 tasks 一致
         """
-        task_type = task.get("type", "general")
-        priority = task.get("priority", "normal")
+        return [self.intelligent_route(task, available_models) for task in tasks]
+    
+    def _score_models(self, task: Dict) -> np.ndarray:
+        """
+        向量化计算所有模型的路由评分
+        
+        考虑因素：任务能力匹配 (0.5)、API成本 (0.3，越低越好)、延迟 (0.2，越低越好)，
+        再按优先级加权
+        """
+        required_mask = np.uint64(self._get_required_mask(task.get("type", "general")))
+        capability_match = ((self._cap_masks & required_mask) != 0).astype(np.float64)
         
-        # 能力匹配评分
-        capability_match = 0.0
-        if any(cap in model.capabilities for cap in self._get_required_capabilities(task_type)):
-            capability_match = 1.0
+        priority_weight = self._get_priority_weight(task.get("priority", "normal"))
         
-        # 成本评分 (越低越好)
-        cost_score = 1.0 / (model.cost_per_token * 1000 + 0.001)
+        if score_kernel is not None:
+            scores = np.empty(len(self._model_ids), dtype=np.float64)
+            score_kernel(self._cost, self._latency, capability_match, priority_weight, scores)
+            return scores
         
-        # 延迟评分 (越低越好)
-        latency_score = 1.0 / (model.latency_ms + 1)
+        cost_score = 1.0 / (self._cost * 1000 + 0.001)
+        latency_score = 1.0 / (self._latency + 1)
         
-        # 优先级加权
-        priority_weight = 1.0
+        return (capability_match * 0.5 + cost_score * 0.3 + latency_score * 0.2) * priority_weight
+    
+    def _get_priority_weight(self, priority: str) -> float:
+        """获取优先级权重"""
         if priority == "high":
-            priority_weight = 1.5
+            return 1.5
         elif priority == "low":
-            priority_weight = 0.5
-        
-        total_score = (capability_match * 0.5 + cost_score * 0.3 + latency_score * 0.2) * priority_weight
-        
-        return total_score
-    
-    def _get_required_capabilities(self, task_type: str) -> List[str]:
-        """获取任务所需能力"""
-        capability_map = {
-            "reasoning": ["reasoning"],
-            "coding": ["coding"],
-            "analysis": ["analysis"],
-            "writing": ["writing"],
-            "vision": ["vision"],
-            "general": ["reasoning", "analysis"]
-        }
-        return capability_map.get(task_type, ["general"])
-    
-    def _get_routing_reason(self, task: Dict, model_id: str) -> str:
-        """获取路由原因"""
-        model = self.models.get(model_id)
-        if model:
-            return f"Selected {model_id} for {task.get('type', 'general')} task"
-        return f"Selected {model_id} based on routing rules"
+            return 0.5
+        return 1.0
+    
+    def _get_required_mask(self, task_type: str) -> int:
+        """获取任务所需能力掩码"""
+        return _TASK_CAP_MASKS.get(task_type, _DEFAULT_CAP_MASK)
     
     def cross_model_style_coherence(
         self, 
@@ -10,14 +10,22 @@ Knowledge Capsule System
 - Historical Reproduction (历史复现): 用现代眼光发现旧知识
 """
 
-from typing import Dict, List, Any, Optional
+from typing import Deque, Dict, Iterator, List, Any, Optional, Set, Tuple
 from dataclasses import dataclass, field
-from datetime import datetime
-import json
+from datetime import date, datetime
+from collections import OrderedDict, defaultdict, deque
 import hashlib
+import json
+import sys
+import time
 
+try:
+    import orjson
+except ImportError:  # orjson 为可选依赖，缺失时退回标准库 json
+    orjson = None
 
-@dataclass
+
+@dataclass(slots=True)
 class CoreInsight:
     """核心洞察"""
     summary: str
@@ -34,7 +42,7 @@ class CoreInsight:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class CapsuleContext:
     """胶囊上下文"""
     domain: str
@@ -51,7 +59,7 @@ class CapsuleContext:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class CapsuleOrigin:
     """胶囊溯源"""
     discovered_by: str
@@ -70,7 +78,7 @@ class CapsuleOrigin:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class CapsuleEvolution:
     """胶囊演进"""
     version: str
@@ -87,7 +95,7 @@ class CapsuleEvolution:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class CrossDomainFusion:
     """跨域融合"""
     domains_involved: List[str]
@@ -106,7 +114,7 @@ class CrossDomainFusion:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class KnowledgeCapsule:
     """
     知识胶囊
@@ -131,8 +139,12 @@ class KnowledgeCapsule:
     
     def _generate_id(self) -> str:
         """生成胶囊ID"""
-        content = f"{self.core_insight.summary}{self.context.domain}{datetime.now().isoformat()}"
-        return f"KC-{datetime.now().strftime('%Y-%m-%d')}-{hashlib.md5(content.encode()).hexdigest()[:8]}"
+        # blake2b(digest_size=4) 直接产出8位十六进制摘要，无需截断
+        digest = hashlib.blake2b(digest_size=4)
+        digest.update(self.core_insight.summary.encode('utf-8'))
+        digest.update(self.context.domain.encode('utf-8'))
+        digest.update(time.time_ns().to_bytes(8, 'big'))
+        return f"KC-{date.today().isoformat()}-{digest.hexdigest()}"
     
     def to_dict(self) -> Dict:
         return {
@@ -146,43 +158,69 @@ class KnowledgeCapsule:
     
     def to_markdown(self) -> str:
         """转换为Markdown格式"""
-        md = f"""# {self.id}
-
-## 💎 Core Insight
-**{self.core_insight.summary}**
-- Details: {self.core_insight.details}
-- Confidence: {self.core_insight.confidence:.2f}
-- Sources: {', '.join(self.core_insight.sources)}
-
-## 📊 Context
-- Domain: {self.context.domain}
-- Discipline: {self.context.discipline}
-- Tags: {', '.join(self.context.tags)}
-- Related Capsules: {', '.join(self.context.related_capsules)}
+        return "".join(self.iter_markdown_lines())
+    
+    def _get_joined_fields(self) -> Tuple[str, ...]:
+        """各列表字段的拼接字符串（每次按当前内容计算，列表可被直接修改）"""
+        return (
+            ', '.join(self.core_insight.sources),
+            ', '.join(self.context.tags),
+            ', '.join(self.context.related_capsules),
+            ', '.join(self.evolution.modifications),
+            ', '.join(self.evolution.improvement_notes),
+            ', '.join(self.cross_domain_fusion.domains_involved) if self.cross_domain_fusion else ""
+        )
+    
+    def iter_markdown_lines(self) -> Iterator[str]:
+        """逐行生成Markdown内容（每行以换行符结尾）"""
+        sources, tags, related, modifications, improvements, fusion_domains = self._get_joined_fields()
+        
+        yield f"# {self.id}\n"
+        yield "\n"
+        yield "## 💎 Core Insight\n"
+        yield f"**{self.core_insight.summary}**\n"
+        yield f"- Details: {self.core_insight.details}\n"
+        yield f"- Confidence: {self.core_insight.confidence:.2f}\n"
+        yield f"- Sources: {sources}\n"
+        yield "\n"
+        yield "## 📊 Context\n"
+        yield f"- Domain: {self.context.domain}\n"
+        yield f"- Discipline: {self.context.discipline}\n"
+        yield f"- Tags: {tags}\n"
+        yield f"- Related Capsules: {related}\n"
+        yield "\n"
+        yield "## 🔗 Origin\n"
+        yield f"- Discovered by: {self.origin.discovered_by}\n"
+        yield f"- Date: {self.origin.discovery_date}\n"
+        yield f"- Method: {self.origin.discovery_method}\n"
+        yield f"- Source: {self.origin.original_source}\n"
+        yield f"- Verification: {self.origin.verification_status}\n"
+        yield "\n"
+        yield "## 🔄 Evolution\n"
+        yield f"- Version: {self.evolution.version}\n"
+        yield f"- Modified: {self.evolution.modified_date}\n"
+        yield f"- Modifications: {modifications}\n"
+        yield f"- Improvements: {improvements}\n"
+        yield "\n"
+        
+        if self.cross_domain_fusion:
+            yield "## 🌐 Cross-Domain Fusion\n"
+            yield f"- Domains: {fusion_domains}\n"
+            yield f"- Method: {self.cross_domain_fusion.fusion_method}\n"
+            yield f"- Emergent Insight: {self.cross_domain_fusion.emergent_insight}\n"
+            yield f"- Novelty Score: {self.cross_domain_fusion.novelty_score:.2f}\n"
+            yield "\n"
 
-## 🔗 Origin
-- Discovered by: {self.origin.discovered_by}
-- Date: {self.origin.discovery_date}
-- Method: {self.origin.discovery_method}
-- Source: {self.origin.original_source}
-- Verification: {self.origin.verification_status}
 
-## 🔄 Evolution
-- Version: {self.evolution.version}
-- Modified: {self.evolution.modified_date}
-- Modifications: {', '.join(self.evolution.modifications)}
-- Improvements: {', '.join(self.evolution.improvement_notes)}
+def _unordered_pair(key: Tuple[str, str]) -> Tuple[str, str]:
+    """将有序ID对规范化为与方向无关的键"""
+    a, b = key
+    return key if a <= b else (b, a)
 
-"""
-        if self.cross_domain_fusion:
-            md += f"""## 🌐 Cross-Domain Fusion
-- Domains: {', '.join(self.cross_domain_fusion.domains_involved)}
-- Method: {self.cross_domain_fusion.fusion_method}
-- Emergent Insight: {self.cross_domain_fusion.emergent_insight}
-- Novelty Score: {self.cross_domain_fusion.novelty_score:.2f}
 
-"""
-        return md
+def _copy_collision(analysis: Dict) -> Dict:
+    """复制碰撞分析结果（含其中的列表），隔离缓存与调用方"""
+    return {**analysis, "domains": list(analysis["domains"]), "insights": list(analysis["insights"])}
 
 
 class KnowledgeCapsuleSystem:
@@ -195,8 +233,21 @@ class KnowledgeCapsuleSystem:
     def __init__(self, config: Dict[str, Any] = None):
         self.config = config or {}
         self.capsules: Dict[str, KnowledgeCapsule] = {}
-        self.semantic_index: Dict[str, List[str]] = {}  # 语义索引
-        self.collision_pairs: List[Dict] = []  # 碰撞记录
+        # 语义索引：关键词 → 有序ID集合（dict键保持插入顺序，O(1)去重）
+        self.semantic_index: Dict[str, Dict[str, None]] = defaultdict(dict)
+        # 碰撞记录：有界环形缓冲，元素为 (timestamp, (capsule1_id, capsule2_id))，
+        # 分析结果可凭该ID对从 _collision_cache 取回；容量为 0 时不记录也不缓存
+        max_history = self.config.get("max_collision_history", 10_000)
+        if max_history is not None and max_history < 0:
+            raise ValueError(f"max_collision_history must be non-negative, got {max_history}")
+        self.collision_pairs: Deque[Tuple[str, Tuple[str, str]]] = deque(maxlen=max_history)
+        # 碰撞分析缓存（按有序ID对，有界LRU，容量与碰撞记录一致），
+        # 以及碰撞记录中现存的无序ID对（随环形缓冲淘汰同步移除）
+        self._collision_cache: "OrderedDict[Tuple[str, str], Dict]" = OrderedDict()
+        self._recorded_pairs: Set[Tuple[str, str]] = set()
+        # 领域/学科 → 胶囊ID 倒排索引（按创建顺序）
+        self._domain_index: Dict[str, List[str]] = defaultdict(list)
+        self._discipline_index: Dict[str, List[str]] = defaultdict(list)
         self._id_counter = 0
     
     # ==================== Capsule Management ====================
@@ -219,8 +270,51 @@ class KnowledgeCapsuleSystem:
         
         封装：创建可复用的知识单元
         """
+        return self._build_capsule(
+            datetime.now().isoformat(),
+            insight_summary,
+            insight_details,
+            confidence,
+            domain,
+            discipline,
+            discovered_by,
+            discovery_method,
+            original_source,
+            tags,
+            cross_domain_fusion
+        )
+    
+    def create_capsules_bulk(self, items: List[Dict]) -> List[KnowledgeCapsule]:
+        """
+        批量创建知识胶囊
+        
+        每个元素的键与 create_capsule 的参数相同；整批共用一次取时
+        """
+        now_iso = datetime.now().isoformat()
+        return [self._build_capsule(now_iso, **item) for item in items]
+    
+    def _build_capsule(
+        self,
+        now_iso: str,
+        insight_summary: str,
+        insight_details: str,
+        confidence: float,
+        domain: str,
+        discipline: str,
+        discovered_by: str,
+        discovery_method: str,
+        original_source: str,
+        tags: List[str] = None,
+        cross_domain_fusion: Dict = None
+    ) -> KnowledgeCapsule:
+        """构建单个胶囊并写入存储与索引（now_iso 供同一胶囊的各时间字段共用）"""
         self._id_counter += 1
         
+        # 领域/学科/标签取值有限且高度重复，驻留后全局共享同一字符串对象
+        domain = sys.intern(domain)
+        discipline = sys.intern(discipline)
+        tags = [sys.intern(tag) for tag in (tags or [])]
+        
         # 核心洞察
         core_insight = CoreInsight(
             summary=insight_summary,
@@ -233,13 +327,13 @@ class KnowledgeCapsuleSystem:
         context = CapsuleContext(
             domain=domain,
             discipline=discipline,
-            tags=tags or []
+            tags=tags
         )
         
         # 溯源
         origin = CapsuleOrigin(
             discovered_by=discovered_by,
-            discovery_date=datetime.now().isoformat(),
+            discovery_date=now_iso,
             discovery_method=discovery_method,
             original_source=original_source
         )
@@ -247,7 +341,7 @@ class KnowledgeCapsuleSystem:
         # 演进
         evolution = CapsuleEvolution(
             version="1.0",
-            modified_date=datetime.now().isoformat(),
+            modified_date=now_iso,
             modifications=["Initial creation"],
             improvement_notes=[]
         )
@@ -264,7 +358,7 @@ class KnowledgeCapsuleSystem:
         
         # 创建胶囊
         capsule = KnowledgeCapsule(
-            id=f"KC-{datetime.now().strftime('%Y-%m-%d')}-{self._id_counter:04d}",
+            id=sys.intern(f"KC-{now_iso[:10]}-{self._id_counter:04d}"),
             core_insight=core_insight,
             context=context,
             origin=origin,
@@ -284,12 +378,16 @@ class KnowledgeCapsuleSystem:
         """获取胶囊"""
         return self.capsules.get(capsule_id)
     
+    def iter_capsules(self, domain: str = None) -> Iterator[KnowledgeCapsule]:
+        """遍历胶囊（不复制列表）"""
+        if domain:
+            capsules = self.capsules
+            return (capsules[cid] for cid in self._domain_index.get(domain, ()))
+        return iter(self.capsules.values())
+    
     def list_capsules(self, domain: str = None) -> List[KnowledgeCapsule]:
         """列出胶囊"""
-        capsules = list(self.capsules.values())
-        if domain:
-            capsules = [c for c in capsules if c.context.domain == domain]
-        return capsules
+        return list(self.iter_capsules(domain))
     
     def update_capsule(
         self,
@@ -362,6 +460,12 @@ class KnowledgeCapsuleSystem:
         
         发现两个胶囊之间的关联和冲突
         """
+        key = (capsule1_id, capsule2_id)
+        cached = self._collision_cache.get(key)
+        if cached is not None:
+            self._collision_cache.move_to_end(key)
+            return _copy_collision(cached)
+        
         capsule1 = self.capsules.get(capsule1_id)
         capsule2 = self.capsules.get(capsule2_id)
         
@@ -369,35 +473,52 @@ class KnowledgeCapsuleSystem:
             return {"error": "One or both capsules not found"}
         
         # 分析碰撞
-        domains = [capsule1.context.domain, capsule2.context.domain]
-        domain_overlap = len(set(domains)) < len(domains)
+        domain1 = capsule1.context.domain
+        domain2 = capsule2.context.domain
+        same_domain = domain1 == domain2  # 领域字符串已驻留，通常命中身份比较
         
         collision_analysis = {
             "capsule1": capsule1_id,
             "capsule2": capsule2_id,
-            "domains": domains,
-            "domain_overlap": domain_overlap,
-            "collision_type": self._analyze_collision_type(capsule1, capsule2),
+            "domains": [domain1, domain2],
+            "domain_overlap": same_domain,
+            "collision_type": self._analyze_collision_type(capsule1, capsule2, same_domain),
             "insights": self._extract_collision_insights(capsule1, capsule2),
-            "collision_strength": self._calculate_collision_strength(capsule1, capsule2)
+            "collision_strength": self._calculate_collision_strength(capsule1, capsule2, same_domain)
         }
         
-        # 记录碰撞
-        self.collision_pairs.append({
-            "pair": [capsule1_id, capsule2_id],
-            "analysis": collision_analysis,
-            "timestamp": datetime.now().isoformat()
-        })
+        capacity = self.collision_pairs.maxlen  # None 表示不设上限
+        if capacity == 0:
+            return collision_analysis
+        
+        # 缓存保存私有副本，调用方修改返回值不会影响后续命中
+        cache = self._collision_cache
+        cache[key] = _copy_collision(collision_analysis)
+        if capacity is not None and len(cache) > capacity:
+            cache.popitem(last=False)
+        
+        # 记录碰撞（同一对胶囊只记录一次，与方向无关）
+        pair_key = _unordered_pair(key)
+        if pair_key not in self._recorded_pairs:
+            if capacity is not None and len(self.collision_pairs) == capacity:
+                # 环形缓冲即将淘汰最早的记录，同步释放其去重键
+                _, evicted = self.collision_pairs.popleft()
+                self._recorded_pairs.discard(_unordered_pair(evicted))
+            self._recorded_pairs.add(pair_key)
+            self.collision_pairs.append((datetime.now().isoformat(), key))
         
         return collision_analysis
     
     def _analyze_collision_type(
         self,
         c1: KnowledgeCapsule,
-        c2: KnowledgeCapsule
+        c2: KnowledgeCapsule,
+        same_domain: bool = None
     ) -> str:
         """分析碰撞类型"""
-        if c1.context.domain == c2.context.domain:
+        if same_domain is None:
+            same_domain = c1.context.domain == c2.context.domain
+        if same_domain:
             return "intra_domain"  # 同域增强
         else:
             return "cross_domain"  # 跨域融合
@@ -422,14 +543,17 @@ class KnowledgeCapsuleSystem:
     def _calculate_collision_strength(
         self,
         c1: KnowledgeCapsule,
-        c2: KnowledgeCapsule
+        c2: KnowledgeCapsule,
+        same_domain: bool = None
     ) -> float:
         """计算碰撞强度"""
         # 基于置信度和跨域程度
         base_strength = (c1.core_insight.confidence + c2.core_insight.confidence) / 2
         
         # 如果跨域，增加强度
-        if c1.context.domain != c2.context.domain:
+        if same_domain is None:
+            same_domain = c1.context.domain == c2.context.domain
+        if not same_domain:
             base_strength *= 1.2
         
         return min(base_strength, 1.0)
@@ -511,21 +635,25 @@ class KnowledgeCapsuleSystem:
             capsule.context.discipline
         ] + capsule.context.tags
         
+        self._domain_index[capsule.context.domain].append(capsule.id)
+        self._discipline_index[capsule.context.discipline].append(capsule.id)
+        
         for keyword in keywords:
-            if keyword not in self.semantic_index:
-                self.semantic_index[keyword] = []
-            if capsule.id not in self.semantic_index[keyword]:
-                self.semantic_index[keyword].append(capsule.id)
+            self.semantic_index[keyword][capsule.id] = None
     
     def search_by_keyword(self, keyword: str) -> List[KnowledgeCapsule]:
         """关键词搜索"""
-        capsule_ids = self.semantic_index.get(keyword, [])
+        capsule_ids = self.semantic_index.get(keyword, ())
         return [self.capsules[id] for id in capsule_ids if id in self.capsules]
     
     def search_by_domain(self, domain: str) -> List[KnowledgeCapsule]:
         """领域搜索"""
         return self.list_capsules(domain)
     
+    def search_by_discipline(self, discipline: str) -> List[KnowledgeCapsule]:
+        """学科搜索"""
+        return [self.capsules[cid] for cid in self._discipline_index.get(discipline, ())]
+    
     # ==================== Export ====================
     
     def export_to_json(self) -> Dict:
@@ -533,20 +661,34 @@ class KnowledgeCapsuleSystem:
         return {
             "total_capsules": len(self.capsules),
             "collision_events": len(self.collision_pairs),
-            "capsules": {k: v.to_dict() for k, v in self.capsules.items()}
+            "capsules": {c.id: c.to_dict() for c in self.iter_capsules()}
         }
     
-    def export_to_markdown(self, output_path: str):
-        """导出为Markdown"""
-        content = "# Knowledge Capsule Collection\n\n"
-        content += f"Total: {len(self.capsules)} capsules\n\n"
+    def export_to_json_bytes(self) -> bytes:
+        """
+        导出为JSON (UTF-8 bytes)
         
-        for capsule in self.capsules.values():
-            content += capsule.to_markdown()
-            content += "\n---\n\n"
+        安装 orjson 时直接序列化胶囊dataclass，不构建中间dict
+        """
+        if orjson is None:
+            return json.dumps(self.export_to_json(), ensure_ascii=False).encode("utf-8")
         
-        with open(output_path, 'w', encoding='utf-8') as f:
-            f.write(content)
+        return orjson.dumps({
+            "total_capsules": len(self.capsules),
+            "collision_events": len(self.collision_pairs),
+            "capsules": self.capsules
+        })
+    
+    def export_to_markdown(self, output_path: str):
+        """导出为Markdown"""
+        # 流式写出，避免在内存中拼接整份文档
+        with open(output_path, 'w', encoding='utf-8', buffering=1 << 20) as f:
+            f.write("# Knowledge Capsule Collection\n\n")
+            f.write(f"Total: {len(self.capsules)} capsules\n\n")
+            
+            for capsule in self.iter_capsules():
+                f.writelines(capsule.iter_markdown_lines())
+                f.write("\n---\n\n")
     
     def get_system_status(self) -> Dict:
         """获取系统状态"""
@@ -554,5 +696,5 @@ class KnowledgeCapsuleSystem:
             "total_capsules": len(self.capsules),
             "collision_events": len(self.collision_pairs),
             "indexed_keywords": len(self.semantic_index),
-            "domains": list(set(c.context.domain for c in self.capsules.values()))
+            "domains": list(self._domain_index)
         }
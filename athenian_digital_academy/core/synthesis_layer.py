@@ -5,10 +5,9 @@ L7: System-Level Synthesis Layer
 实现多智能体仲裁合成，包含加权投票机制和安全约束
 """
 
-from typing import Dict, List, Any, Optional
-from dataclasses import dataclass, field
+from typing import Dict, List, Any
+from dataclasses import dataclass
 from enum import Enum
-import json
 
 
 class AgentType(Enum):
@@ -20,7 +19,11 @@ class AgentType(Enum):
     PRACTICAL = "practical"    # 实用型
 
 
-@dataclass
+# 智能体类型 → 取值
+_AGENT_TYPE_VALUES = {t: t.value for t in AgentType}
+
+
+@dataclass(slots=True)
 class AgentOutput:
     """智能体输出"""
     agent_type: AgentType
@@ -30,7 +33,7 @@ class AgentOutput:
     safety_score: float  # 安全评分
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class EvaluationCriteria:
     """评估标准"""
     name: str
@@ -39,6 +42,40 @@ class EvaluationCriteria:
     safety_impact: float
 
 
+def _truncate(text: str, limit: int) -> str:
+    """截断为预览文本，仅在超长时复制"""
+    return text[:limit] + "..." if len(text) > limit else text
+
+
+# 默认评估标准
+_DEFAULT_CRITERIA = (
+    EvaluationCriteria(
+        name="creativity",
+        description="创新性和想象力",
+        weight=0.3,
+        safety_impact=0.1
+    ),
+    EvaluationCriteria(
+        name="safety",
+        description="安全性和合规性",
+        weight=0.3,
+        safety_impact=0.8  # 高安全影响
+    ),
+    EvaluationCriteria(
+        name="ethics",
+        description="伦理考量和包容性",
+        weight=0.2,
+        safety_impact=0.6
+    ),
+    EvaluationCriteria(
+        name="practicality",
+        description="实用性和可行性",
+        weight=0.2,
+        safety_impact=0.2
+    ),
+)
+
+
 class SynthesisLayer:
     """
     系统级合成层
@@ -52,38 +89,9 @@ class SynthesisLayer:
     
     def __init__(self, config: Dict[str, Any] = None):
         self.config = config or {}
-        self.criteria: List[EvaluationCriteria] = []
+        # 默认评估标准为不可变实例，各合成层共享同一组对象
+        self.criteria: List[EvaluationCriteria] = list(_DEFAULT_CRITERIA)
         self.safety_module = SafetyModule()
-        self._init_default_criteria()
-    
-    def _init_default_criteria(self):
-        """初始化默认评估标准"""
-        self.criteria = [
-            EvaluationCriteria(
-                name="creativity",
-                description="创新性和想象力",
-                weight=0.3,
-                safety_impact=0.1
-            ),
-            EvaluationCriteria(
-                name="safety",
-                description="安全性和合规性",
-                weight=0.3,
-                safety_impact=0.8  # 高安全影响
-            ),
-            EvaluationCriteria(
-                name="ethics",
-                description="伦理考量和包容性",
-                weight=0.2,
-                safety_impact=0.6
-            ),
-            EvaluationCriteria(
-                name="practicality",
-                description="实用性和可行性",
-                weight=0.2,
-                safety_impact=0.2
-            )
-        ]
     
     # ==================== Core Synthesis ====================
     
@@ -100,21 +108,22 @@ class SynthesisLayer:
         if not outputs:
             return {"error": "No outputs to synthesize"}
         
-        # 1. 计算每个输出的综合评分
-        scored_outputs = []
+        # 1. 单次遍历累计综合评分、安全分与权重
+        n = len(outputs)
+        total_raw = 0.0
+        total_safety = 0.0
+        total_weight = 0.0
         for output in outputs:
-            score = self._calculate_composite_score(output)
-            scored_outputs.append({
-                "agent_type": output.agent_type.value,
-                "content": output.content[:100] + "..." if len(output.content) > 100 else output.content,
-                "raw_score": score,
-                "weight": output.weight,
-                "confidence": output.confidence,
-                "safety_score": output.safety_score
-            })
+            safety_score = output.safety_score
+            # 综合评分 = 权重 * 置信度 + 安全调整 (与 _calculate_composite_score 一致)
+            total_raw += output.weight * output.confidence + safety_score * 0.2
+            total_safety += safety_score
+            total_weight += output.weight
         
         # 2. 加权投票
-        voting_result = self._weighted_voting(scored_outputs)
+        voting_result = self._weighted_voting(
+            outputs, total_raw, total_safety, total_weight, n
+        )
         
         # 3. 安全检查
         safety_check = self.safety_module.check(voting_result["final_output"])
@@ -154,7 +163,14 @@ class SynthesisLayer:
         
         return base_score + safety_adjustment
     
-    def _weighted_voting(self, scored_outputs: List[Dict]) -> Dict:
+    def _weighted_voting(
+        self,
+        outputs: List[AgentOutput],
+        total_raw: float,
+        total_safety: float,
+        total_weight: float,
+        n: int
+    ) -> Dict:
         """
         加权投票
         
@@ -162,27 +178,28 @@ class SynthesisLayer:
         y* = argmax_y∈On ∑_{i=1}^n wi·U(y|role_i) + λ·Safety(y)
         """
         # 简化的投票实现
-        total_weight = sum(o["weight"] for o in scored_outputs)
+        raw_mean = total_raw / n
+        safety_mean = total_safety / n
         
         # 计算各标准的分数
         scores = {
-            "creativity": sum(o["raw_score"] * 0.3 for o in scored_outputs) / len(scored_outputs),
-            "safety": sum(o["safety_score"] * 0.3 for o in scored_outputs) / len(scored_outputs),
-            "ethics": sum(o["raw_score"] * 0.2 for o in scored_outputs) / len(scored_outputs),
-            "practicality": sum(o["raw_score"] * 0.2 for o in scored_outputs) / len(scored_outputs)
+            "creativity": 0.3 * raw_mean,
+            "safety": 0.3 * safety_mean,
+            "ethics": 0.2 * raw_mean,
+            "practicality": 0.2 * raw_mean
         }
         
-        # 综合评分
-        final_score = sum(scores[key] for key in scores)
+        # 综合评分 = 0.3+0.2+0.2 倍评分均值 + 0.3 倍安全均值
+        final_score = 0.7 * raw_mean + 0.3 * safety_mean
         
-        # 包容性指数 (基于论文：4.5 vs 1.8)
-        inclusivity_index = scores["ethics"] * 4.5 / 3.0
+        # 包容性指数 (基于论文：4.5 vs 1.8)，即 ethics * 4.5 / 3.0
+        inclusivity_index = 0.3 * raw_mean
         
-        # 刻板印象分数 (基于论文：1.6 vs 4.2)
-        stereotype_score = (1.0 - scores["ethics"]) * 4.2 / 3.0
+        # 刻板印象分数 (基于论文：1.6 vs 4.2)，即 (1 - ethics) * 4.2 / 3.0
+        stereotype_score = 1.4 - 0.28 * raw_mean
         
         # 选择最佳输出 (简化为选择最高评分的输出内容)
-        best_output = scored_outputs[0]["content"]
+        best_output = _truncate(outputs[0].content, 100)
         
         return {
             "final_output": best_output,
@@ -214,7 +231,7 @@ class SynthesisLayer:
         检测内容中的刻板印象和偏见
         """
         return {
-            "content": content[:50] + "..." if len(content) > 50 else content,
+            "content": _truncate(content, 50),
             "bias_detected": False,
             "bias_type": None,
             "bias_score": 0.0,
@@ -235,7 +252,7 @@ class SynthesisLayer:
         """
         return {
             "panel_id": panel_id,
-            "agents": [a.value for a in agents],
+            "agents": list(map(_AGENT_TYPE_VALUES.__getitem__, agents)),
             "status": "ready",
             "created": True
         }
@@ -244,23 +261,26 @@ class SynthesisLayer:
         self,
         panel_id: str,
         topic: str,
-        options: List[str]
+        options: List[str],
+        include_losers: bool = True
     ) -> Dict:
         """
         执行仲裁
         
         多智能体对选项进行投票和仲裁
+        include_losers 为 False 时，vote_results 仅包含胜出选项
         """
-        # 模拟仲裁结果
-        vote_results = {
-            option: {"votes": 0, "agents": []} for option in options
-        }
-        
         # 模拟投票 (实际应该由真实智能体投票)
         selected = options[0]  # 默认选择第一个
         
-        vote_results[selected]["votes"] = 3  # 3票
-        vote_results[selected]["agents"] = ["creative", "analytic", "practical"]
+        # 模拟仲裁结果：3票
+        vote_results = {
+            selected: {"votes": 3, "agents": ["creative", "analytic", "practical"]}
+        }
+        if include_losers:
+            for option in options:
+                if option not in vote_results:
+                    vote_results[option] = {"votes": 0, "agents": []}
         
         return {
             "panel_id": panel_id,
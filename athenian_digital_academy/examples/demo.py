@@ -6,16 +6,12 @@ Demo: Multi-Agent Collaboration
 from athenian_digital_academy import AthenianDigitalAcademy
 
 
-def demo_collaboration():
+def demo_collaboration(academy: AthenianDigitalAcademy):
     """演示多智能体协作"""
     print("=" * 60)
     print("Athenian Digital Academy - Multi-Agent Collaboration Demo")
     print("=" * 60)
     
-    # 创建系统
-    academy = AthenianDigitalAcademy()
-    academy.initialize()
-    
     # 定义任务
     task = {
         "type": "strategic_analysis",
@@ -38,14 +34,12 @@ def demo_collaboration():
     return result
 
 
-def demo_knowledge_capsule():
+def demo_knowledge_capsule(academy: AthenianDigitalAcademy):
     """演示知识胶囊"""
     print("\n" + "=" * 60)
     print("Knowledge Capsule Demo")
     print("=" * 60)
     
-    academy = AthenianDigitalAcademy()
-    
     # 创建胶囊
     print("\n2. 创建知识胶囊...")
     capsule = academy.create_knowledge_capsule(
@@ -66,14 +60,12 @@ def demo_knowledge_capsule():
     return capsule
 
 
-def demo_critical_rationalism():
+def demo_critical_rationalism(academy: AthenianDigitalAcademy):
     """演示批判理性主义"""
     print("\n" + "=" * 60)
     print("Critical Rationalism Demo")
     print("=" * 60)
     
-    academy = AthenianDigitalAcademy()
-    
     # 运行批判循环
     print("\n3. 运行批判理性主义循环...")
     conjecture = "AI模型可以通过自我反思不断提升性能，无需外部干预。"
@@ -94,14 +86,12 @@ def demo_critical_rationalism():
     return result
 
 
-def demo_arbitration():
+def demo_arbitration(academy: AthenianDigitalAcademy):
     """演示仲裁合成"""
     print("\n" + "=" * 60)
     print("Arbitration Synthesis Demo")
     print("=" * 60)
     
-    academy = AthenianDigitalAcademy()
-    
     # 仲裁合成
     print("\n4. 执行仲裁合成...")
     inputs = [
@@ -125,27 +115,29 @@ def main():
     print("🧠 Athenian Digital Academy - Complete Demo")
     print("=" * 60)
     
+    # 创建系统 (各演示共用同一实例)
+    academy = AthenianDigitalAcademy()
+    academy.initialize()
+    
     # 1. 多智能体协作
-    demo_collaboration()
+    demo_collaboration(academy)
     
     # 2. 知识胶囊
-    demo_knowledge_capsule()
+    demo_knowledge_capsule(academy)
     
     # 3. 批判理性主义
-    demo_critical_rationalism()
+    demo_critical_rationalism(academy)
     
     # 4. 仲裁合成
-    demo_arbitration()
+    demo_arbitration(academy)
     
     # 获取系统状态
-    academy = AthenianDigitalAcademy()
-    academy.initialize()
     status = academy.get_status()
     
     print("\n" + "=" * 60)
     print("📊 System Status")
     print("=" * 60)
-    print(f"   状态: {status['status']}")
+    print(f"   已初始化: {status['initialized']}")
     print(f"   Agent层: {status['layers']['agent']['status']}")
     print(f"   Synthesis层: {status['layers']['synthesis']['layer']}")
     print(f"   包容性提升: {status['layers']['synthesis']['performance']['inclusivity_improvement']}")
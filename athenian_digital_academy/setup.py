@@ -24,13 +24,11 @@ setup(
         "License :: OSI Approved :: MIT License",
         "Operating System :: OS Independent",
         "Programming Language :: Python :: 3",
-        "Programming Language :: Python :: 3.8",
-        "Programming Language :: Python :: 3.9",
         "Programming Language :: Python :: 3.10",
     ],
-    python_requires=">=3.8",
+    python_requires=">=3.10",
     install_requires=[
-        "python>=3.8",
+        "python>=3.10",
         "numpy>=1.19.0",
         "pandas>=1.2.0",
         "dataclasses>=0.6; python_version<'3.7'",
@@ -41,6 +39,9 @@ setup(
         "ml": ["torch>=1.8.0", "transformers>=4.5.0"],
         "api": ["openai>=0.27.0", "anthropic>=0.3.0"],
         "vector": ["faiss-cpu>=1.7.0"],
+        "jit": ["numba>=0.57.0"],
+        "json": ["orjson>=3.6.0"],
+        "hash": ["xxhash>=3.0.0"],
         "dev": ["pytest>=6.0.0", "pytest-cov>=2.0.0"],
     },
     entry_points={
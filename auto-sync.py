@@ -4,12 +4,8 @@ OpenSpider自动同步脚本
 监控workspace文件变化，自动提交并推送到GitHub
 """
 
-import os
-import sys
 import time
 import subprocess
-import hashlib
-from pathlib import Path
 
 # 配置
 WORKSPACE = "/root/.openclaw/workspace"
@@ -19,12 +15,28 @@ REPO_NAME = "openspider"
 BRANCH = "main"
 CHECK_INTERVAL = 10  # 检查间隔(秒)
 
-def get_file_hash(filepath):
-    """获取文件hash"""
-    if not os.path.exists(filepath):
-        return None
-    with open(filepath, 'rb') as f:
-        return hashlib.md5(f.read()).hexdigest()
+def get_pending_changes():
+    """
+    获取未提交的变更
+    
+    直接使用 git status --porcelain，由git索引的stat快速路径完成比对
+    """
+    result = subprocess.run(
+        ['git', 'status', '--porcelain'],
+        cwd=WORKSPACE,
+        capture_output=True,
+        text=True
+    )
+    changes = []
+    for line in result.stdout.splitlines():
+        if not line.strip():
+            continue
+        status, rel_path = line[:2], line[3:]
+        if 'D' in status:
+            changes.append(f"[删除] {rel_path}")
+        else:
+            changes.append(rel_path)
+    return changes
 
 def get_tracked_files():
     """获取Git追踪的文件"""
@@ -87,33 +99,10 @@ def main():
     print(f"⏰ 检查间隔: {CHECK_INTERVAL}秒")
     print("-" * 50)
     
-    # 记录文件hash
-    file_hashes = {}
-    
     while True:
         try:
-            # 检查所有md、py、sh文件
-            current_files = {}
-            for ext in ['*.md', '*.py', '*.sh', '*.js', '*.json']:
-                for filepath in Path(WORKSPACE).glob(f"**/{ext}"):
-                    if 'node_modules' in str(filepath) or '.git' in str(filepath):
-                        continue
-                    current_files[str(filepath)] = get_file_hash(filepath)
-            
             # 检测变更
-            changes = []
-            for filepath, file_hash in current_files.items():
-                rel_path = os.path.relpath(filepath, WORKSPACE)
-                prev_hash = file_hashes.get(rel_path)
-                if prev_hash != file_hash:
-                    changes.append(rel_path)
-                file_hashes[rel_path] = file_hash
-            
-            # 移除已删除的文件
-            for rel_path in list(file_hashes.keys()):
-                if rel_path not in current_files:
-                    del file_hashes[rel_path]
-                    changes.append(f"[删除] {rel_path}")
+            changes = get_pending_changes()
             
             # 有变更则提交推送
             if changes:
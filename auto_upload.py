@@ -11,107 +11,232 @@ OpenSpider文档自动同步工具
 import os
 import sys
 import base64
-import subprocess
 import requests
+from requests.adapters import HTTPAdapter
 import json
-from pathlib import Path
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
 
 # 配置
 TOKEN = "${GITHUB_TOKEN}"
 REPO = "openspider/openspider"
+BRANCH = "main"
+WORKSPACE = "/root/.openclaw/workspace"
+API_URL = f"https://api.github.com/repos/{REPO}"
+MAX_WORKERS = 16  # 并发创建blob的线程数
 HEADERS = {
     "Authorization": f"token {TOKEN}",
     "Accept": "application/vnd.github.v3+json",
     "User-Agent": "OpenSpider-AutoSync/1.0"
 }
 
+# 复用HTTP连接 (keep-alive)，避免每次请求重新进行TCP+TLS握手
+SESSION = requests.Session()
+SESSION.headers.update(HEADERS)
+SESSION.mount("https://", HTTPAdapter(pool_connections=MAX_WORKERS, pool_maxsize=MAX_WORKERS))
+
 # 忽略列表
 IGNORE_DIRS = ['.git', 'node_modules', '__pycache__']
-IGNORE_FILES = ['.deploy-config.json', 'auto_upload.py', 'auto-sync.py']
-
-def get_file_sha(filename):
-    """获取文件的SHA"""
-    url = f"https://api.github.com/repos/{REPO}/contents/{filename}"
-    resp = requests.get(url, headers=HEADERS)
-    if resp.status_code == 200:
-        return resp.json().get('sha')
-    return None
+IGNORE_FILES = ['.deploy-config.json', 'auto_upload.py', 'auto-sync.py', '.sync_cache.json']
+IGNORE_DIR_SET = frozenset(IGNORE_DIRS)
+IGNORE_FILE_SET = frozenset(IGNORE_FILES)
 
-def upload_file(filename, message=None):
-    """上传单个文件"""
-    filepath = Path(filename)
-    if not filepath.exists():
-        print(f"   ❌ 文件不存在: {filename}")
-        return False
+# 同步的文件类型
+SYNC_EXTS = frozenset(['.md', '.py', '.sh', '.js', '.json'])
+
+# 同步缓存 {rel_path: [mtime_ns, size, blob_sha]}，跳过上次同步后未变更的文件
+SYNC_CACHE_FILE = os.path.join(WORKSPACE, ".sync_cache.json")
+
+def get_all_files():
+    """获取所有需要同步的文件 (单次遍历目录树)"""
+    files = []
+    workspace = WORKSPACE
     
-    # 读取内容
-    with open(filepath, 'r', encoding='utf-8') as f:
+    for root, dirs, names in os.walk(workspace):
+        # 原地裁剪，不进入忽略目录
+        dirs[:] = [d for d in dirs if d not in IGNORE_DIR_SET]
+        rel_root = os.path.relpath(root, workspace)
+        for name in names:
+            if os.path.splitext(name)[1] not in SYNC_EXTS:
+                continue
+            rel_path = name if rel_root == '.' else os.path.join(rel_root, name)
+            if rel_path not in IGNORE_FILE_SET:
+                files.append(rel_path)
+    
+    return files
+
+def create_blob(filename):
+    """创建单个文件的blob，返回blob SHA"""
+    with open(os.path.join(WORKSPACE, filename), 'rb') as f:
         content = f.read()
     
-    # 获取SHA
-    sha = get_file_sha(filename)
+    resp = SESSION.post(f"{API_URL}/git/blobs", json={
+        "content": base64.b64encode(content).decode('ascii'),
+        "encoding": "base64"
+    })
+    if resp.status_code == 201:
+        return resp.json()['sha']
+    print(f"   ❌ {filename}: {resp.json().get('message', 'error')}")
+    return None
+
+def commit_files(files, message=None):
+    """
+    通过Git Data API将一批文件合并为一次提交
+    
+    blob并发创建，随后仅需 读ref → 读基准提交 → 建tree → 建commit → 更新ref 五次串行请求
+    返回 ({成功文件: blob SHA}, 失败文件列表)
+    """
+    # 1. 并发创建blob
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        blob_shas = list(executor.map(create_blob, files))
+    
+    uploaded, failed, tree = {}, [], []
+    for filename, sha in zip(files, blob_shas):
+        if not sha:
+            failed.append(filename)
+            continue
+        uploaded[filename] = sha
+        executable = os.access(os.path.join(WORKSPACE, filename), os.X_OK)
+        tree.append({
+            "path": filename,
+            "mode": "100755" if executable else "100644",
+            "type": "blob",
+            "sha": sha
+        })
+    if not uploaded:
+        return {}, failed
     
-    # 上传
-    url = f"https://api.github.com/repos/{REPO}/contents/{filename}"
-    data = {
-        "message": message or f"docs: 更新 {filename}",
-        "content": base64.b64encode(content.encode('utf-8')).decode('utf-8'),
-        "sha": sha
-    }
+    # 2. 获取分支当前提交及其tree
+    resp = SESSION.get(f"{API_URL}/git/refs/heads/{BRANCH}")
+    if resp.status_code != 200:
+        print(f"   ❌ 获取分支失败: {resp.json().get('message', 'error')}")
+        return {}, files
+    base_sha = resp.json()['object']['sha']
+    resp = SESSION.get(f"{API_URL}/git/commits/{base_sha}")
+    if resp.status_code != 200:
+        print(f"   ❌ 获取基准提交失败: {resp.json().get('message', 'error')}")
+        return {}, files
+    base_tree = resp.json()['tree']['sha']
     
-    resp = requests.put(url, headers=HEADERS, json=data)
+    # 3. 创建tree
+    resp = SESSION.post(f"{API_URL}/git/trees", json={
+        "base_tree": base_tree,
+        "tree": tree
+    })
+    if resp.status_code != 201:
+        print(f"   ❌ 创建tree失败: {resp.json().get('message', 'error')}")
+        return {}, files
+    tree_sha = resp.json()['sha']
     
-    if resp.status_code in [200, 201]:
+    # 4. 创建提交
+    resp = SESSION.post(f"{API_URL}/git/commits", json={
+        "message": message or f"docs: 同步 {len(uploaded)} 个文件",
+        "tree": tree_sha,
+        "parents": [base_sha]
+    })
+    if resp.status_code != 201:
+        print(f"   ❌ 创建提交失败: {resp.json().get('message', 'error')}")
+        return {}, files
+    commit_sha = resp.json()['sha']
+    
+    # 5. 更新分支
+    resp = SESSION.patch(f"{API_URL}/git/refs/heads/{BRANCH}", json={"sha": commit_sha})
+    if resp.status_code != 200:
+        print(f"   ❌ 更新分支失败: {resp.json().get('message', 'error')}")
+        return {}, files
+    
+    for filename in uploaded:
         print(f"   ✅ {filename}")
-        return True
-    else:
-        print(f"   ❌ {filename}: {resp.json().get('message', 'error')}")
-        return False
+    return uploaded, failed
 
-def get_all_files():
-    """获取所有需要同步的文件"""
-    files = []
-    workspace = "/root/.openclaw/workspace"
-    
-    for ext in ['*.md', '*.py', '*.sh', '*.js', '*.json']:
-        for f in Path(workspace).glob(f"**/{ext}"):
-            rel_path = str(f.relative_to(workspace))
-            
-            # 忽略
-            skip = False
-            for ignore_dir in IGNORE_DIRS:
-                if ignore_dir in rel_path:
-                    skip = True
-                    break
-            for ignore_file in IGNORE_FILES:
-                if rel_path == ignore_file:
-                    skip = True
-                    break
-            
-            if not skip:
-                files.append(rel_path)
-    
-    return files
+def load_sync_cache():
+    """读取同步缓存"""
+    try:
+        with open(SYNC_CACHE_FILE, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def save_sync_cache(cache):
+    """写回同步缓存"""
+    with open(SYNC_CACHE_FILE, 'w', encoding='utf-8') as f:
+        json.dump(cache, f, ensure_ascii=False)
 
 def sync_all():
     """同步所有文件"""
     print(f"\n🚀 开始同步到 GitHub: {REPO}")
-    print(f"📁 工作目录: /root/.openclaw/workspace")
+    print(f"📁 工作目录: {WORKSPACE}")
     print("-" * 60)
     
-    files = get_all_files()
-    success = 0
-    failed = 0
+    # 跳过签名 (mtime_ns, size) 与上次成功同步一致的文件
+    cache = load_sync_cache()
+    sigs = {}
+    files = []
+    skipped = 0
+    for filename in sorted(get_all_files()):
+        st = os.stat(os.path.join(WORKSPACE, filename))
+        sig = [st.st_mtime_ns, st.st_size]
+        if cache.get(filename, [None, None, None])[:2] == sig:
+            skipped += 1
+            continue
+        sigs[filename] = sig
+        files.append(filename)
+    
+    uploaded, failed_files = commit_files(files) if files else ({}, [])
+    success = len(uploaded)
+    failed = len(failed_files)
     
-    for filename in sorted(files):
-        if upload_file(filename):
-            success += 1
-        else:
-            failed += 1
+    if uploaded:
+        for filename, blob_sha in uploaded.items():
+            cache[filename] = sigs[filename] + [blob_sha]
+        save_sync_cache(cache)
     
     print("-" * 60)
     print(f"✅ 成功: {success} 个文件")
+    if skipped > 0:
+        print(f"⏭️  未变更: {skipped} 个文件")
+    if failed > 0:
+        print(f"❌ 失败: {failed} 个文件")
+    
+    return failed == 0
+
+def to_workspace_path(filename):
+    """将命令行给出的路径转换为相对于工作目录的仓库路径，无效时返回None"""
+    path = os.path.abspath(filename)
+    if not os.path.isfile(path):
+        print(f"   ❌ 文件不存在: {filename}")
+        return None
+    rel_path = os.path.relpath(path, WORKSPACE)
+    if rel_path.startswith(os.pardir):
+        print(f"   ❌ 不在工作目录内: {filename}")
+        return None
+    return rel_path
+
+def sync_files(args):
+    """同步指定文件：与全量同步相同，合并为一次提交"""
+    print(f"\n🚀 同步指定文件到 GitHub: {REPO}")
+    print("-" * 60)
+    
+    files, invalid = [], 0
+    for filename in args:
+        rel_path = to_workspace_path(filename)
+        if rel_path is None:
+            invalid += 1
+        elif rel_path not in files:
+            files.append(rel_path)
+    
+    # 逐文件PUT会各自生成提交并争抢分支头，改为一次tree+一次commit
+    uploaded, failed_files = commit_files(files) if files else ({}, [])
+    failed = len(failed_files) + invalid
+    
+    if uploaded:
+        cache = load_sync_cache()
+        for filename, blob_sha in uploaded.items():
+            st = os.stat(os.path.join(WORKSPACE, filename))
+            cache[filename] = [st.st_mtime_ns, st.st_size, blob_sha]
+        save_sync_cache(cache)
+    
+    print("-" * 60)
+    print(f"✅ 成功: {len(uploaded)} 个文件")
     if failed > 0:
         print(f"❌ 失败: {failed} 个文件")
     
@@ -120,14 +245,11 @@ def sync_all():
 def main():
     if len(sys.argv) > 1:
         # 指定文件
-        files = sys.argv[1:]
-        print(f"\n🚀 同步指定文件到 GitHub: {REPO}")
-        print("-" * 60)
-        for filename in files:
-            upload_file(filename)
+        ok = sync_files(sys.argv[1:])
     else:
         # 同步所有
-        sync_all()
+        ok = sync_all()
+    sys.exit(0 if ok else 1)
 
 if __name__ == "__main__":
     main()
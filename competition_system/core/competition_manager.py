@@ -2,11 +2,39 @@
 Competition System Core - 比赛系统核心
 """
 
-from typing import Dict, List, Any
-from dataclasses import dataclass
+from typing import Dict, List, Any, Hashable, Sequence, Tuple
+from dataclasses import dataclass, field, fields, replace
 from enum import Enum
+from operator import attrgetter
 from datetime import datetime
+from collections import defaultdict
+import bisect
+import heapq
+import itertools
 import json
+import sys
+import time
+
+try:
+    import numpy as np
+except ImportError:  # numpy 为可选依赖，缺失时批量评分退化为纯Python
+    np = None
+
+try:
+    import orjson
+except ImportError:  # orjson 为可选依赖，缺失时使用标准库 json
+    orjson = None
+
+
+def _dumps(obj: Any) -> str:
+    """序列化为JSON字符串，优先使用 orjson 的C实现"""
+    if orjson is not None:
+        return orjson.dumps(obj).decode()
+    return json.dumps(obj, ensure_ascii=False)
+
+
+# 排名/结果读缓存有效期 (毫秒)
+CACHE_TTL_MS = 30000
 
 
 class CompetitionStatus(Enum):
@@ -26,9 +54,14 @@ class Track(Enum):
     INNOVATION = "innovation" # 创新
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Competition:
-    """比赛"""
+    """
+    比赛
+    
+    冻结快照：状态切换由管理器替换为新实例，已持有的旧引用不会随之更新，
+    需要当前状态时经 CompetitionManager.get_competition 重新获取
+    """
     id: str
     name: str
     description: str
@@ -40,24 +73,45 @@ class Competition:
     entry_fee: float
     prizes: Dict
     evaluation_criteria: Dict
+    # 评分标准键顺序与权重向量，创建时计算一次，供批量评分使用
+    _crit_keys: Tuple[str, ...] = field(init=False, repr=False, compare=False)
+    _weights: Any = field(init=False, repr=False, compare=False)
+    _crit_items: Tuple[Tuple[str, float], ...] = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        # 冻结实例，派生字段经 object.__setattr__ 写入
+        # replace() 经 __init__ 重新执行本方法：init=False 的派生字段总是重新计算，不会从旧实例复制
+        # 评分标准复制一份私有dict，调用方随后修改原dict不会使派生字段失配
+        object.__setattr__(self, "evaluation_criteria", dict(self.evaluation_criteria))
+        # 驻留状态与赛道字符串，过滤比较时命中身份比较快速路径
+        object.__setattr__(self, "status", sys.intern(self.status))
+        object.__setattr__(self, "track", sys.intern(self.track))
+        object.__setattr__(self, "_crit_keys", tuple(self.evaluation_criteria))
+        object.__setattr__(self, "_crit_items", tuple(self.evaluation_criteria.items()))
+        weights = tuple(self.evaluation_criteria.values())
+        object.__setattr__(
+            self, "_weights",
+            np.asarray(weights, dtype=np.float64) if np is not None else weights
+        )
+    
+    @property
+    def criteria_keys(self) -> Tuple[str, ...]:
+        """评分矩阵的列顺序"""
+        return self._crit_keys
     
     def to_dict(self) -> Dict:
-        return {
-            "id": self.id,
-            "name": self.name,
-            "description": self.description,
-            "track": self.track,
-            "status": self.status,
-            "start_date": self.start_date,
-            "end_date": self.end_date,
-            "max_participants": self.max_participants,
-            "entry_fee": self.entry_fee,
-            "prizes": self.prizes,
-            "evaluation_criteria": self.evaluation_criteria
-        }
+        return dict(zip(_COMPETITION_KEYS, _competition_values(self)))
+    
+    def to_json(self) -> str:
+        return _dumps(self.to_dict())
 
 
-@dataclass
+# 序列化字段表：由dataclass字段生成，属性取值器在模块加载时绑定一次
+_COMPETITION_KEYS = tuple(f.name for f in fields(Competition) if f.init)
+_competition_values = attrgetter(*_COMPETITION_KEYS)
+
+
+@dataclass(slots=True)
 class Team:
     """参赛团队"""
     id: str
@@ -69,18 +123,17 @@ class Team:
     rank: int = 0
     
     def to_dict(self) -> Dict:
-        return {
-            "id": self.id,
-            "name": self.name,
-            "members": self.members,
-            "competition_id": self.competition_id,
-            "submission": self.submission,
-            "score": self.score,
-            "rank": self.rank
-        }
+        return dict(zip(_TEAM_KEYS, _team_values(self)))
+    
+    def to_json(self) -> str:
+        return _dumps(self.to_dict())
+
+
+_TEAM_KEYS = tuple(f.name for f in fields(Team) if f.init)
+_team_values = attrgetter(*_TEAM_KEYS)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ScoringResult:
     """评分结果"""
     competition_id: str
@@ -91,14 +144,85 @@ class ScoringResult:
     feedback: str
     
     def to_dict(self) -> Dict:
-        return {
-            "competition_id": self.competition_id,
-            "team_id": self.team_id,
-            "scores": self.scores,
-            "total_score": self.total_score,
-            "rank": self.rank,
-            "feedback": self.feedback
+        return dict(zip(_SCORING_RESULT_KEYS, _scoring_result_values(self)))
+    
+    def to_json(self) -> str:
+        return _dumps(self.to_dict())
+
+
+_SCORING_RESULT_KEYS = tuple(f.name for f in fields(ScoringResult) if f.init)
+_scoring_result_values = attrgetter(*_SCORING_RESULT_KEYS)
+
+
+# 示例比赛模板：导入时构建一次；奖项/评分标准为可变dict，各管理器加载时复制
+_SAMPLE_COMPS = (
+    Competition(
+        id="paper_sprint_2026_01",
+        name="论文冲刺赛 Q1",
+        description="1个月内发表1篇顶会论文",
+        track=Track.RESEARCH.value,
+        status=CompetitionStatus.OPEN.value,
+        start_date="2026-01-15",
+        end_date="2026-01-31",
+        max_participants=50,
+        entry_fee=0,
+        prizes={
+            "gold": {"cash": 100000, "title": "论文之星"},
+            "silver": {"cash": 50000, "title": "优秀论文"},
+            "bronze": {"cash": 20000, "title": "潜力论文"}
+        },
+        evaluation_criteria={
+            "publication_quality": 0.40,
+            "innovation": 0.30,
+            "methodology": 0.20,
+            "writing": 0.10
         }
+    ),
+    Competition(
+        id="industry_analysis_2026_01",
+        name="产业分析赛 Q1",
+        description="2周完成深度产业分析报告",
+        track=Track.INDUSTRY.value,
+        status=CompetitionStatus.OPEN.value,
+        start_date="2026-01-20",
+        end_date="2026-02-03",
+        max_participants=100,
+        entry_fee=0,
+        prizes={
+            "gold": {"cash": 50000, "title": "产业洞察专家"},
+            "silver": {"cash": 20000, "title": "优秀分析师"},
+            "bronze": {"cash": 10000, "title": "潜力分析师"}
+        },
+        evaluation_criteria={
+            "analysis_depth": 0.30,
+            "insight_quality": 0.30,
+            "business_acumen": 0.25,
+            "presentation": 0.15
+        }
+    ),
+    Competition(
+        id="innovation_sprint_2026_01",
+        name="创意热身赛 Q1",
+        description="1周内生成3个创新方案",
+        track=Track.INNOVATION.value,
+        status=CompetitionStatus.OPEN.value,
+        start_date="2026-01-25",
+        end_date="2026-01-31",
+        max_participants=200,
+        entry_fee=0,
+        prizes={
+            "gold": {"cash": 30000, "title": "创新先锋"},
+            "silver": {"cash": 10000, "title": "创意达人"},
+            "bronze": {"cash": 5000, "title": "创新新星"}
+        },
+        evaluation_criteria={
+            "novelty": 0.40,
+            "feasibility": 0.30,
+            "impact": 0.20,
+            "presentation": 0.10
+        }
+    )
+)
 
 
 class CompetitionManager:
@@ -108,92 +232,89 @@ class CompetitionManager:
     管理比赛全流程
     """
     
-    def __init__(self):
+    def __init__(self, load_samples: bool = False):
         self.competitions: Dict[str, Competition] = {}
         self.teams: Dict[str, Team] = {}
-        self.results: Dict[str, ScoringResult] = {}
-        self._init_sample_competitions()
+        # 评分结果：competition_id → {team_id: 结果}
+        self.results: Dict[str, Dict[str, ScoringResult]] = defaultdict(dict)
+        # 按总分降序维护的结果列表：competition_id → [(-总分, 序号, 结果)]
+        # _result_entries 记录各团队当前条目，更新评分时据此定位旧条目
+        self._ranked_results: Dict[str, List[Tuple[float, int, ScoringResult]]] = defaultdict(list)
+        self._result_entries: Dict[str, Dict[str, Tuple[float, int, ScoringResult]]] = defaultdict(dict)
+        self._result_seq = itertools.count()
+        # 倒排索引：状态/赛道 → 比赛ID集合；_comp_pos 记录创建顺序以保持列表顺序
+        self._by_status: Dict[str, set] = defaultdict(set)
+        self._by_track: Dict[str, set] = defaultdict(set)
+        self._comp_pos: Dict[str, int] = {}
+        self._ranked_by: Dict[str, Hashable] = {}  # 比赛 → 最近一次赋名次的排名查询
+        # 读缓存：key → (版本, 时间戳ms, 值)；版本不符或超过TTL即失效
+        self._cache: Dict[Hashable, Tuple[int, float, Any]] = {}
+        self._versions: Dict[str, int] = defaultdict(int)  # 各比赛的数据版本
+        self._global_version = 0  # 任一比赛变更即递增 (排行榜跨比赛)
+        # 单调递增的ID序列，避免 hash(name) % 10000 的碰撞覆盖
+        self._comp_seq = itertools.count(1)
+        self._team_seq = itertools.count(1)
+        if load_samples:
+            self._init_sample_competitions()
     
     def _init_sample_competitions(self):
-        """初始化示例比赛"""
-        sample_comps = [
-            Competition(
-                id="paper_sprint_2026_01",
-                name="论文冲刺赛 Q1",
-                description="1个月内发表1篇顶会论文",
-                track=Track.RESEARCH.value,
-                status=CompetitionStatus.OPEN.value,
-                start_date="2026-01-15",
-                end_date="2026-01-31",
-                max_participants=50,
-                entry_fee=0,
-                prizes={
-                    "gold": {"cash": 100000, "title": "论文之星"},
-                    "silver": {"cash": 50000, "title": "优秀论文"},
-                    "bronze": {"cash": 20000, "title": "潜力论文"}
-                },
-                evaluation_criteria={
-                    "publication_quality": 0.40,
-                    "innovation": 0.30,
-                    "methodology": 0.20,
-                    "writing": 0.10
-                }
-            ),
-            Competition(
-                id="industry_analysis_2026_01",
-                name="产业分析赛 Q1",
-                description="2周完成深度产业分析报告",
-                track=Track.INDUSTRY.value,
-                status=CompetitionStatus.OPEN.value,
-                start_date="2026-01-20",
-                end_date="2026-02-03",
-                max_participants=100,
-                entry_fee=0,
-                prizes={
-                    "gold": {"cash": 50000, "title": "产业洞察专家"},
-                    "silver": {"cash": 20000, "title": "优秀分析师"},
-                    "bronze": {"cash": 10000, "title": "潜力分析师"}
-                },
-                evaluation_criteria={
-                    "analysis_depth": 0.30,
-                    "insight_quality": 0.30,
-                    "business_acumen": 0.25,
-                    "presentation": 0.15
-                }
-            ),
-            Competition(
-                id="innovation_sprint_2026_01",
-                name="创意热身赛 Q1",
-                description="1周内生成3个创新方案",
-                track=Track.INNOVATION.value,
-                status=CompetitionStatus.OPEN.value,
-                start_date="2026-01-25",
-                end_date="2026-01-31",
-                max_participants=200,
-                entry_fee=0,
-                prizes={
-                    "gold": {"cash": 30000, "title": "创新先锋"},
-                    "silver": {"cash": 10000, "title": "创意达人"},
-                    "bronze": {"cash": 5000, "title": "创新新星"}
-                },
-                evaluation_criteria={
-                    "novelty": 0.40,
-                    "feasibility": 0.30,
-                    "impact": 0.20,
-                    "presentation": 0.10
-                }
-            )
-        ]
+        """初始化示例比赛 (复制模块级模板的嵌套dict，管理器之间互不影响)"""
+        for comp in _SAMPLE_COMPS:
+            self._add_competition(replace(
+                comp,
+                prizes={tier: dict(prize) for tier, prize in comp.prizes.items()}
+            ))
+    
+    # ==================== 读缓存 ====================
+    
+    def _bump_version(self, competition_id: str):
+        """标记比赛数据已变更，O(1)使相关缓存失效"""
+        self._versions[competition_id] += 1
+        self._global_version += 1
+    
+    def _cache_get(self, key: Hashable, version: int):
+        """读取缓存，未命中返回 None"""
+        entry = self._cache.get(key)
+        if entry is None:
+            return None
+        cached_version, timestamp, value = entry
+        if cached_version != version or time.monotonic() * 1000 - timestamp > CACHE_TTL_MS:
+            return None
+        return value
+    
+    def _cache_put(self, key: Hashable, version: int, value: Any):
+        """写入缓存"""
+        self._cache[key] = (version, time.monotonic() * 1000, value)
+    
+    # ==================== 比赛索引 ====================
+    
+    def _add_competition(self, comp: Competition):
+        """登记比赛并更新状态/赛道索引"""
+        old = self.competitions.get(comp.id)
+        if old is not None:
+            self._by_status[old.status].discard(old.id)
+            self._by_track[old.track].discard(old.id)
+        self.competitions[comp.id] = comp
+        self._comp_pos.setdefault(comp.id, len(self._comp_pos))
+        self._by_status[comp.status].add(comp.id)
+        self._by_track[comp.track].add(comp.id)
+    
+    def _set_status(self, comp: Competition, status: str):
+        """
+        切换比赛状态并移动状态索引
         
-        for comp in sample_comps:
-            self.competitions[comp.id] = comp
+        替换为新的冻结实例 (派生字段由 __post_init__ 重新计算)；此前取得的旧实例保留原状态
+        """
+        self._by_status[comp.status].discard(comp.id)
+        self.competitions[comp.id] = replace(comp, status=status)
+        self._by_status[status].add(comp.id)
     
     # ==================== 比赛管理 ====================
     
     def create_competition(self, config: Dict) -> Competition:
         """创建比赛"""
         comp = Competition(
-            id=f"comp_{hash(config['name']) % 10000}",
+            id=f"comp_{next(self._comp_seq)}",
             name=config["name"],
             description=config.get("description", ""),
             track=config.get("track", Track.INNOVATION.value),
@@ -205,7 +326,8 @@ class CompetitionManager:
             prizes=config.get("prizes", {}),
             evaluation_criteria=config.get("evaluation_criteria", {})
         )
-        self.competitions[comp.id] = comp
+        self._add_competition(comp)
+        self._bump_version(comp.id)
         return comp
     
     def list_competitions(
@@ -213,15 +335,24 @@ class CompetitionManager:
         status: str = None, 
         track: str = None
     ) -> List[Competition]:
-        """列出比赛"""
-        result = list(self.competitions.values())
+        """
+        列出比赛
         
-        if status:
-            result = [c for c in result if c.status == status]
-        if track:
-            result = [c for c in result if c.track == track]
+        按状态/赛道过滤时走倒排索引，仅访问命中的比赛
+        """
+        if not status and not track:
+            return list(self.competitions.values())
         
-        return result
+        if status and track:
+            ids = self._by_status.get(status, set()) & self._by_track.get(track, set())
+        elif status:
+            ids = self._by_status.get(status, set())
+        else:
+            ids = self._by_track.get(track, set())
+        
+        # 保持创建顺序；sorted 直接消费生成器，仅物化一次结果列表
+        pos = self._comp_pos
+        return sorted((self.competitions[i] for i in ids), key=lambda c: pos[c.id])
     
     def get_competition(self, competition_id: str) -> Competition:
         """获取比赛"""
@@ -231,7 +362,7 @@ class CompetitionManager:
         """开放报名"""
         comp = self.competitions.get(competition_id)
         if comp:
-            comp.status = CompetitionStatus.OPEN.value
+            self._set_status(comp, CompetitionStatus.OPEN.value)
             return True
         return False
     
@@ -239,7 +370,7 @@ class CompetitionManager:
         """开始比赛"""
         comp = self.competitions.get(competition_id)
         if comp:
-            comp.status = CompetitionStatus.IN_PROGRESS.value
+            self._set_status(comp, CompetitionStatus.IN_PROGRESS.value)
             return True
         return False
     
@@ -247,7 +378,7 @@ class CompetitionManager:
         """结束比赛"""
         comp = self.competitions.get(competition_id)
         if comp:
-            comp.status = CompetitionStatus.CLOSED.value
+            self._set_status(comp, CompetitionStatus.CLOSED.value)
             return True
         return False
     
@@ -261,12 +392,13 @@ class CompetitionManager:
     ) -> Team:
         """参赛"""
         team = Team(
-            id=f"team_{hash(team_name) % 10000}",
+            id=f"team_{next(self._team_seq)}",
             name=team_name,
             members=members,
             competition_id=competition_id
         )
         self.teams[team.id] = team
+        self._bump_version(competition_id)
         return team
     
     def submit(
@@ -283,13 +415,15 @@ class CompetitionManager:
                 "description": description,
                 "timestamp": datetime.now().isoformat()
             }
+            self._bump_version(team.competition_id)
             return True
         return False
     
     def withdraw(self, team_id: str) -> bool:
         """退出"""
-        if team_id in self.teams:
-            del self.teams[team_id]
+        team = self.teams.pop(team_id, None)
+        if team:
+            self._bump_version(team.competition_id)
             return True
         return False
     
@@ -309,11 +443,9 @@ class CompetitionManager:
         if not comp or not team:
             return None
         
-        # 计算总分
-        total = 0
-        for criterion, weight in comp.evaluation_criteria.items():
-            if criterion in scores:
-                total += scores[criterion] * weight
+        # 计算总分 (缺失的评分项计0分，每项仅一次字典探查)
+        get = scores.get
+        total = sum(get(criterion, 0) * weight for criterion, weight in comp._crit_items)
         
         result = ScoringResult(
             competition_id=competition_id,
@@ -324,50 +456,153 @@ class CompetitionManager:
             feedback=feedback
         )
         
-        self.results[f"{competition_id}_{team_id}"] = result
+        self._record_result(result)
         team.score = total
+        self._bump_version(competition_id)
         
         return result
     
-    def calculate_rankings(self, competition_id: str) -> List[Team]:
-        """计算排名"""
+    def _record_result(self, result: ScoringResult):
+        """
+        记录评分结果并维护有序列表
+        
+        二分插入，O(log N) 定位；重新评分的团队沿用首次评分的序号，
+        同分时的先后顺序与首次评分顺序一致
+        """
+        competition_id, team_id = result.competition_id, result.team_id
+        self.results[competition_id][team_id] = result
+        
+        ranked = self._ranked_results[competition_id]
+        entries = self._result_entries[competition_id]
+        old = entries.get(team_id)
+        if old is not None:
+            del ranked[bisect.bisect_left(ranked, old)]
+            seq = old[1]
+        else:
+            seq = next(self._result_seq)
+        entry = (-result.total_score, seq, result)
+        bisect.insort(ranked, entry)
+        entries[team_id] = entry
+    
+    def batch_evaluate(
+        self,
+        competition_id: str,
+        scores_matrix: Sequence[Sequence[float]],
+        team_ids: List[str],
+        feedback: str = ""
+    ) -> List[ScoringResult]:
+        """
+        批量评分
+        
+        scores_matrix 每行对应 team_ids 中的一个团队，列顺序为
+        comp.criteria_keys；总分由一次矩阵-向量乘积得到。
+        未知团队将被跳过。
+        """
+        comp = self.competitions.get(competition_id)
+        if not comp:
+            return []
+        
+        keys = comp.criteria_keys
+        if np is not None:
+            matrix = np.asarray(scores_matrix, dtype=np.float64).reshape(len(team_ids), len(keys))
+            totals = (matrix @ comp._weights).tolist()
+            rows = matrix.tolist()
+        else:
+            rows = [list(row) for row in scores_matrix]
+            totals = [sum(v * w for v, w in zip(row, comp._weights)) for row in rows]
+        
+        results = []
+        for team_id, row, total in zip(team_ids, rows, totals):
+            team = self.teams.get(team_id)
+            if not team:
+                continue
+            result = ScoringResult(
+                competition_id=competition_id,
+                team_id=team_id,
+                scores=dict(zip(keys, row)),
+                total_score=total,
+                rank=0,  # 待计算
+                feedback=feedback
+            )
+            self._record_result(result)
+            team.score = total
+            results.append(result)
+        
+        self._bump_version(competition_id)
+        return results
+    
+    def calculate_rankings(self, competition_id: str, top_k: int = None) -> List[Team]:
+        """
+        计算排名 (同一数据版本内直接复用上次结果)
+        
+        指定 top_k 时两阶段排名：先按分数划分出前 top_k 名，仅对其精排并
+        赋予名次 1..top_k，其余团队名次置 0；返回前 top_k 名
+        """
+        key = ("rankings", competition_id, top_k)
+        version = self._versions[competition_id]
+        cached = self._cache_get(key, version)
+        # 名次写在团队对象上，仅当上次赋名次的正是本查询时才可直接复用
+        if cached is not None and self._ranked_by.get(competition_id) == key:
+            return list(cached)
+        
         teams = [t for t in self.teams.values() if t.competition_id == competition_id]
-        teams.sort(key=lambda t: t.score, reverse=True)
+        if top_k is not None and top_k < len(teams):
+            ranked = self._top_k_teams(teams, top_k)
+            for team in teams:
+                team.rank = 0
+        else:
+            teams.sort(key=lambda t: t.score, reverse=True)
+            ranked = teams
+        
+        for team, rank in zip(ranked, range(1, len(ranked) + 1)):
+            team.rank = rank
         
-        for i, team in enumerate(teams, 1):
-            team.rank = i
+        self._ranked_by[competition_id] = key
+        self._cache_put(key, version, ranked)
+        return list(ranked)
+    
+    @staticmethod
+    def _top_k_teams(teams: List[Team], k: int) -> List[Team]:
+        """
+        选出分数最高的 k 个团队并按分数降序排列
+        
+        O(N) 划分求第 k 大分数，仅对不低于该分数的候选排序；
+        同分按原顺序，与全量稳定排序后截断的结果一致
+        """
+        if k <= 0:
+            return []
+        if np is None:
+            return heapq.nlargest(k, teams, key=lambda t: t.score)
         
-        return teams
+        scores = np.fromiter((t.score for t in teams), dtype=np.float64, count=len(teams))
+        n = scores.shape[0]
+        kth = np.partition(scores, n - k)[n - k]
+        candidates = np.flatnonzero(scores >= kth).tolist()
+        score_list = scores.tolist()
+        candidates.sort(key=lambda i: score_list[i], reverse=True)
+        return [teams[i] for i in candidates[:k]]
     
     def get_results(
         self, 
         competition_id: str, 
         top_n: int = 10
     ) -> List[ScoringResult]:
-        """获取结果"""
-        results = []
-        for key, result in self.results.items():
-            if key.startswith(competition_id):
-                results.append(result)
-        
-        results.sort(key=lambda r: r.total_score, reverse=True)
-        return results[:top_n]
+        """获取结果 (有序列表切片，读时无需排序)"""
+        ranked = self._ranked_results.get(competition_id)
+        if not ranked:
+            return []
+        return [entry[2] for entry in ranked[:top_n]]
     
     # ==================== 统计系统 ====================
     
     def get_statistics(self) -> Dict:
         """获取统计"""
         total_comps = len(self.competitions)
-        active_comps = len([c for c in self.competitions.values() if c.status == "open"])
+        active_comps = len(self._by_status.get(CompetitionStatus.OPEN.value, ()))
         total_teams = len(self.teams)
         
-        # 按赛道统计
-        track_stats = {}
-        for comp in self.competitions.values():
-            track = comp.track
-            if track not in track_stats:
-                track_stats[track] = 0
-            track_stats[track] += 1
+        # 按赛道统计 (直接读取赛道索引的桶大小)
+        track_stats = {track: len(ids) for track, ids in self._by_track.items() if ids}
         
         return {
             "total_competitions": total_comps,
@@ -379,21 +614,45 @@ class CompetitionManager:
     
     def get_leaderboard(self, track: str = None) -> List[Team]:
         """排行榜"""
-        teams = list(self.teams.values())
-        teams.sort(key=lambda t: t.score, reverse=True)
+        key = ("leaderboard", track)
+        cached = self._cache_get(key, self._global_version)
+        if cached is not None:
+            return list(cached)
         
+        teams = self.teams.values()
         if track:
-            comp_ids = [c.id for c in self.competitions.values() if c.track == track]
+            comp_ids = {c.id for c in self.competitions.values() if c.track == track}
             teams = [t for t in teams if t.competition_id in comp_ids]
         
-        return teams[:100]
+        # 前100名：堆选择，与稳定排序后截断结果一致
+        teams = heapq.nlargest(100, teams, key=lambda t: t.score)
+        self._cache_put(key, self._global_version, teams)
+        return list(teams)
+    
+    # ==================== 批量序列化 ====================
+    
+    def leaderboard_json(self, track: str = None) -> str:
+        """
+        排行榜JSON
+        
+        整个列表一次序列化，优先于逐个调用 Team.to_json
+        """
+        return _dumps([t.to_dict() for t in self.get_leaderboard(track)])
+    
+    def results_json(self, competition_id: str, top_n: int = 10) -> str:
+        """
+        评分结果JSON
+        
+        整个列表一次序列化，优先于逐个调用 ScoringResult.to_json
+        """
+        return _dumps([r.to_dict() for r in self.get_results(competition_id, top_n)])
 
 
 # ==================== 便捷函数 ====================
 
-def create_competition_manager() -> CompetitionManager:
+def create_competition_manager(load_samples: bool = False) -> CompetitionManager:
     """创建比赛管理器"""
-    return CompetitionManager()
+    return CompetitionManager(load_samples=load_samples)
 
 
 if __name__ == "__main__":
@@ -401,7 +660,7 @@ if __name__ == "__main__":
     print("🏆 Competition System - Demo")
     print("=" * 60)
     
-    manager = CompetitionManager()
+    manager = CompetitionManager(load_samples=True)
     
     print("\n📊 系统统计:")
     stats = manager.get_statistics()
@@ -0,0 +1,47 @@
+"""
+Template Serialization Helpers
+模板与序列化工具
+
+各数字科学家共用：只读模板dict与dataclass的JSON序列化
+"""
+
+from typing import Any
+import copy
+import json
+
+try:
+    import orjson
+except ImportError:  # orjson 为可选依赖，缺失时使用标准库 json
+    orjson = None
+
+
+class ReadOnlyDict(dict):
+    """
+    只读dict
+
+    模板常量跨调用共享，禁止原地修改；仍是dict子类，json/orjson可直接序列化。
+    copy/deepcopy/pickle 得到普通dict，复制后即可自由修改
+    """
+    __slots__ = ()
+
+    def _readonly(self, *args, **kwargs):
+        raise TypeError(f"{type(self).__name__} 为只读模板，请先 dict(...) 复制后再修改")
+
+    __setitem__ = __delitem__ = __ior__ = _readonly
+    clear = pop = popitem = setdefault = update = _readonly
+
+    def __reduce__(self):
+        return (dict, (dict(self),))
+
+    def __deepcopy__(self, memo):
+        result = memo[id(self)] = {}
+        for k, v in self.items():
+            result[copy.deepcopy(k, memo)] = copy.deepcopy(v, memo)
+        return result
+
+
+def dataclass_json(obj: Any) -> str:
+    """序列化dataclass为JSON字符串：orjson 直接遍历slots，无中间dict"""
+    if orjson is not None:
+        return orjson.dumps(obj).decode()
+    return json.dumps(obj.to_dict(), ensure_ascii=False)
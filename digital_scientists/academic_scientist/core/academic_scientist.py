@@ -4,9 +4,14 @@ Academic Scientist - 学术科学家
 聚焦学术创新、论文发表、学术影响力
 """
 
-from typing import Dict, List, Any
-from dataclasses import dataclass
+from typing import Callable, Dict, List, Any, Optional, Tuple
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, fields
 from enum import Enum
+from functools import lru_cache
+from operator import attrgetter
+from uuid import uuid4
+import threading
 
 
 class AcademicField(Enum):
@@ -27,7 +32,7 @@ class PublicationLevel(Enum):
     EXPERT_REVIEW = "review"    # 综述
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class PaperIdea:
     """论文创意"""
     id: str
@@ -38,17 +43,15 @@ class PaperIdea:
     required_resources: List[str]
     
     def to_dict(self) -> Dict:
-        return {
-            "id": self.id,
-            "title": self.title,
-            "novelty": self.novelty,
-            "feasibility": self.feasibility,
-            "impact_potential": self.impact_potential,
-            "required_resources": self.required_resources
-        }
+        return dict(zip(_PAPER_IDEA_KEYS, _paper_idea_values(self)))
+
 
+# 序列化字段表：由dataclass字段生成，属性取值器在模块加载时绑定一次
+_PAPER_IDEA_KEYS = tuple(f.name for f in fields(PaperIdea) if f.init)
+_paper_idea_values = attrgetter(*_PAPER_IDEA_KEYS)
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class LiteratureReview:
     """文献综述"""
     id: str
@@ -58,13 +61,46 @@ class LiteratureReview:
     future_directions: List[str]
     
     def to_dict(self) -> Dict:
-        return {
-            "id": self.id,
-            "topic": self.topic,
-            "key_papers": self.key_papers,
-            "research_gaps": self.research_gaps,
-            "future_directions": self.future_directions
-        }
+        return dict(zip(_LITERATURE_REVIEW_KEYS, _literature_review_values(self)))
+
+
+_LITERATURE_REVIEW_KEYS = tuple(f.name for f in fields(LiteratureReview) if f.init)
+_literature_review_values = attrgetter(*_LITERATURE_REVIEW_KEYS)
+
+
+# ==================== 模板缓存 ====================
+
+# 研究空白与未来方向 (与主题无关)
+_RESEARCH_GAPS = ("方法论局限", "数据不足", "场景单一")
+_FUTURE_DIRECTIONS = ("多模态融合", "跨领域应用", "理论基础完善")
+
+# 学术前沿趋势 (与领域无关)
+_HOT_TOPICS = ("大语言模型", "多模态学习", "具身智能")
+_RISING_AREAS = ("AI4Science", "可解释AI", "AI安全")
+_DECLINING_AREAS = ("传统CNN", "简单NLP任务")
+_METHODOLOGY_TRENDS = ("Foundation Models", "Prompt Engineering", "Reinforcement Learning")
+
+
+@lru_cache(maxsize=512)
+def _key_papers(topic: str) -> Tuple[str, ...]:
+    """按主题缓存综述的关键论文"""
+    return (
+        f"奠基性论文A ({topic})",
+        f"突破性研究B ({topic})",
+        f"综述性文章C ({topic})"
+    )
+
+
+@lru_cache(maxsize=512)
+def _idea_titles(topic: str) -> Tuple[str, ...]:
+    """按主题缓存论文创意标题模板"""
+    return (
+        f"创新方法：{topic}的新框架",
+        f"跨域融合：{topic}+LLM",
+        f"理论贡献：{topic}的数学基础",
+        f"应用突破：{topic}的实际场景",
+        f"方法创新：{topic}的优化算法"
+    )
 
 
 class AcademicScientist:
@@ -74,8 +110,13 @@ class AcademicScientist:
     聚焦：论文创新、学术影响力、科研高度
     """
     
-    def __init__(self, config: Dict = None):
+    def __init__(self, config: Dict = None, llm_client: Optional[Callable[[str], str]] = None):
         self.config = config or {}
+        # 可选的LLM客户端：接收提示词，返回论文创意标题
+        self.llm_client = llm_client
+        # 进行中的LLM创意生成 (topic, count) → Future，合并并发的相同请求
+        self._inflight: Dict[Tuple[str, int], Future] = {}
+        self._inflight_lock = threading.Lock()
         self.name = "学术科学家"
         self.field = AcademicField.COMPUTER_SCIENCE
         self.papers: List[Dict] = []
@@ -89,24 +130,13 @@ class AcademicScientist:
         
         分析特定主题的研究现状
         """
+        # 综述ID每次新生成，不随主题缓存；以新列表返回，调用方修改不会污染缓存
         return LiteratureReview(
-            id=f"review_{hash(topic) % 10000}",
+            id=f"review_{uuid4().hex}",
             topic=topic,
-            key_papers=[
-                f"奠基性论文A ({topic})",
-                f"突破性研究B ({topic})",
-                f"综述性文章C ({topic})"
-            ],
-            research_gaps=[
-                "方法论局限",
-                "数据不足",
-                "场景单一"
-            ],
-            future_directions=[
-                "多模态融合",
-                "跨领域应用",
-                "理论基础完善"
-            ]
+            key_papers=list(_key_papers(topic)),
+            research_gaps=list(_RESEARCH_GAPS),
+            future_directions=list(_FUTURE_DIRECTIONS)
         )
     
     def analyze_trends(self, field: str) -> Dict:
@@ -117,25 +147,10 @@ class AcademicScientist:
         """
         return {
             "field": field,
-            "hot_topics": [
-                "大语言模型",
-                "多模态学习",
-                "具身智能"
-            ],
-            "rising_areas": [
-                "AI4Science",
-                "可解释AI",
-                "AI安全"
-            ],
-            "declining_areas": [
-                "传统CNN",
-                "简单NLP任务"
-            ],
-            "methodology_trends": [
-                "Foundation Models",
-                "Prompt Engineering",
-                "Reinforcement Learning"
-            ]
+            "hot_topics": list(_HOT_TOPICS),
+            "rising_areas": list(_RISING_AREAS),
+            "declining_areas": list(_DECLINING_AREAS),
+            "methodology_trends": list(_METHODOLOGY_TRENDS)
         }
     
     # ==================== 创新生成 ====================
@@ -146,29 +161,76 @@ class AcademicScientist:
         
         基于研究空白生成创新想法
         """
-        ideas = []
+        if self.llm_client is None:
+            # 模板生成
+            ideas = [
+                self._make_idea(i, title)
+                for i, title in enumerate(_idea_titles(topic)[:count])
+            ]
+        else:
+            ideas, owner = self._generate_ideas_llm(topic, count)
+            if not owner:
+                # 合并到其他线程的同一请求，创意已由发起方记录
+                return list(ideas)
+        self.ideas.extend(ideas)
+        
+        return ideas
+    
+    @staticmethod
+    def _make_idea(i: int, title: str) -> PaperIdea:
+        """按序号构建论文创意"""
+        return PaperIdea(
+            id=f"idea_{uuid4().hex}",
+            title=title,
+            novelty=0.9 - (i * 0.1),
+            feasibility=0.7 + (i * 0.05),
+            impact_potential=0.8 - (i * 0.05),
+            required_resources=["数据集", "算力", "专业知识"]
+        )
+    
+    def _generate_ideas_llm(self, topic: str, count: int) -> Tuple[List[PaperIdea], bool]:
+        """
+        经LLM并发生成论文创意
         
-        base_ideas = [
-            f"创新方法：{topic}的新框架",
-            f"跨域融合：{topic}+LLM",
-            f"理论贡献：{topic}的数学基础",
-            f"应用突破：{topic}的实际场景",
-            f"方法创新：{topic}的优化算法"
-        ]
+        每个创意方向一个请求，线程池并发发出，延迟由 count*RTT 降为约一个RTT；
+        同一 (topic, count) 的并发调用合并为一次生成。
+        返回 (创意列表, 是否为本次发起的生成)
+        """
+        key = (topic, count)
+        with self._inflight_lock:
+            future = self._inflight.get(key)
+            owner = future is None
+            if owner:
+                future = Future()
+                self._inflight[key] = future
+        if not owner:
+            return future.result(), False
         
-        for i, title in enumerate(base_ideas[:count]):
-            idea = PaperIdea(
-                id=f"idea_{i}_{hash(topic) % 10000}",
-                title=title,
-                novelty=0.9 - (i * 0.1),
-                feasibility=0.7 + (i * 0.05),
-                impact_potential=0.8 - (i * 0.05),
-                required_resources=["数据集", "算力", "专业知识"]
-            )
-            self.ideas.append(idea)
-            ideas.append(idea)
+        try:
+            prompts = [
+                f"围绕主题「{topic}」生成一个论文创意标题，方向：{seed}"
+                for seed in _idea_titles(topic)[:count]
+            ]
+            titles: List[str] = [""] * len(prompts)
+            if prompts:
+                with ThreadPoolExecutor(max_workers=len(prompts)) as executor:
+                    futures = {
+                        executor.submit(self.llm_client, prompt): i
+                        for i, prompt in enumerate(prompts)
+                    }
+                    for done in as_completed(futures):
+                        titles[futures[done]] = done.result()
+            ideas = [self._make_idea(i, title) for i, title in enumerate(titles)]
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(ideas)
+        finally:
+            with self._inflight_lock:
+                del self._inflight[key]
         
-        return ideas
+        return ideas, True
     
     def evaluate_novelty(self, idea: str, existing_papers: List[str]) -> Dict:
         """
@@ -334,7 +396,7 @@ class AcademicScientist:
             "metrics": {
                 "citation_target": 500,
                 "h_index_target": 15,
-                "collaboration_target": 5个国际合作
+                "collaboration_target": "5个国际合作"
             }
         }
     
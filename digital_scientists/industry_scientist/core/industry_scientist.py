@@ -4,9 +4,16 @@ Industry Scientist - 产业科学家
 聚焦产业价值创造、技术转化、商业落地
 """
 
-from typing import Dict, List, Any
-from dataclasses import dataclass
+from typing import Dict, List, Any, Mapping, Tuple
+from array import array
+from collections.abc import Sequence
+from dataclasses import dataclass, fields
 from enum import Enum
+from functools import lru_cache
+from operator import attrgetter
+import itertools
+
+from ..._serialization import ReadOnlyDict, dataclass_json
 
 
 class IndustryDomain(Enum):
@@ -28,7 +35,7 @@ class ValueDimension(Enum):
     ROI = "roi"                      # 投资回报
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class IndustryInsight:
     """产业洞察"""
     id: str
@@ -39,35 +46,177 @@ class IndustryInsight:
     risk_level: float
     
     def to_dict(self) -> Dict:
-        return {
-            "id": self.id,
-            "domain": self.domain,
-            "trend": self.trend,
-            "opportunity": self.opportunity,
-            "value_potential": self.value_potential,
-            "risk_level": self.risk_level
-        }
+        return dict(zip(_INDUSTRY_INSIGHT_KEYS, _industry_insight_values(self)))
+    
+    def to_json(self) -> str:
+        return dataclass_json(self)
+
+
+# 序列化字段表：由dataclass字段生成，属性取值器在模块加载时绑定一次
+_INDUSTRY_INSIGHT_KEYS = tuple(f.name for f in fields(IndustryInsight) if f.init)
+_industry_insight_values = attrgetter(*_INDUSTRY_INSIGHT_KEYS)
+
+
+class _InsightColumns(Sequence):
+    """
+    产业洞察的列式存储 (SoA)
+    
+    字符串字段按列存为list，数值字段存为连续的double数组，
+    可直接交给 numpy 做聚合；按下标访问时才组装 IndustryInsight
+    """
+    __slots__ = ("ids", "domains", "trends", "opportunities", "value_potential", "risk_level")
+    
+    def __init__(self):
+        self.ids: List[str] = []
+        self.domains: List[str] = []
+        self.trends: List[str] = []
+        self.opportunities: List[str] = []
+        self.value_potential = array("d")
+        self.risk_level = array("d")
+    
+    def append(self, insight: IndustryInsight):
+        self.ids.append(insight.id)
+        self.domains.append(insight.domain)
+        self.trends.append(insight.trend)
+        self.opportunities.append(insight.opportunity)
+        self.value_potential.append(insight.value_potential)
+        self.risk_level.append(insight.risk_level)
+    
+    def __len__(self) -> int:
+        return len(self.ids)
+    
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self.ids)))]
+        return IndustryInsight(
+            id=self.ids[index],
+            domain=self.domains[index],
+            trend=self.trends[index],
+            opportunity=self.opportunities[index],
+            value_potential=self.value_potential[index],
+            risk_level=self.risk_level[index]
+        )
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class BusinessModel:
     """商业模式"""
     id: str
     name: str
-    revenue_streams: List[str]
-    cost_structure: List[str]
-    key_resources: List[str]
+    revenue_streams: Tuple[str, ...]
+    cost_structure: Tuple[str, ...]
+    key_resources: Tuple[str, ...]
     value_proposition: str
     
     def to_dict(self) -> Dict:
-        return {
-            "id": self.id,
-            "name": self.name,
-            "revenue_streams": self.revenue_streams,
-            "cost_structure": self.cost_structure,
-            "key_resources": self.key_resources,
-            "value_proposition": self.value_proposition
-        }
+        return dict(zip(_BUSINESS_MODEL_KEYS, _business_model_values(self)))
+    
+    def to_json(self) -> str:
+        return dataclass_json(self)
+
+
+_BUSINESS_MODEL_KEYS = tuple(f.name for f in fields(BusinessModel) if f.init)
+_business_model_values = attrgetter(*_BUSINESS_MODEL_KEYS)
+
+
+# ==================== 模板常量 ====================
+# 与参数无关的嵌套模板在导入时构建一次，以只读dict共享；方法返回新的外层dict
+
+# 商业模式骨架 (与创新无关，各模型共享)
+_REVENUE_STREAMS = ("产品销售", "服务订阅", "技术授权")
+_COST_STRUCTURE = ("研发投入", "市场推广", "运营成本")
+_KEY_RESOURCES = ("核心技术", "人才团队", "合作伙伴")
+
+_CAPABILITIES = (
+    "industry_analysis",
+    "opportunity_identification",
+    "value_assessment",
+    "business_design",
+    "roadmap_planning"
+)
+
+_ROADMAP_PHASES: Tuple[Mapping[str, Any], ...] = tuple(ReadOnlyDict(d) for d in (
+    {
+        "phase": "第一阶段 (Year 1)",
+        "focus": "技术验证",
+        "milestones": ("原型开发", "种子用户", "初步验证")
+    },
+    {
+        "phase": "第二阶段 (Year 2)",
+        "focus": "市场拓展",
+        "milestones": ("产品迭代", "规模获客", "收入增长")
+    },
+    {
+        "phase": "第三阶段 (Year 3)",
+        "focus": "生态构建",
+        "milestones": ("行业标准", "生态合作", "IPO/并购")
+    }
+))
+
+_COMPETITORS: Tuple[Mapping[str, Any], ...] = tuple(ReadOnlyDict(d) for d in (
+    {
+        "name": "竞品A",
+        "strengths": ("品牌强", "渠道广"),
+        "weaknesses": ("创新慢", "成本高")
+    },
+    {
+        "name": "竞品B",
+        "strengths": ("技术先进", "价格低"),
+        "weaknesses": ("服务差", "经验少")
+    }
+))
+
+_VALUE_MATRIX: Mapping[str, Mapping[str, str]] = ReadOnlyDict({
+    "economic_value": ReadOnlyDict({
+        "revenue_potential": "10亿+",
+        "cost_savings": "20-30%",
+        "efficiency_gain": "50%+"
+    }),
+    "social_value": ReadOnlyDict({
+        "job_creation": "100+",
+        "skill_development": "1000+",
+        "community_benefit": "高"
+    }),
+    "technological_value": ReadOnlyDict({
+        "innovation_index": "0.82",
+        "ip_potential": "5-10项专利",
+        "knowledge_transfer": "高"
+    })
+})
+
+_INDUSTRY_KEY_PLAYERS = ("头部企业A", "创新企业B", "跨国集团C")
+_INDUSTRY_TRENDS = ("AI应用", "数字化转型", "绿色技术")
+_INDUSTRY_OPPORTUNITIES = (
+    "技术替代窗口期",
+    "政策红利期",
+    "消费升级需求"
+)
+_INDUSTRY_THREATS = (
+    "竞争加剧",
+    "技术迭代快",
+    "监管不确定性"
+)
+
+
+# ==================== 模板缓存 ====================
+# 字符串模板为参数的纯函数：按参数缓存格式化结果，重复调用不再拼接
+
+@lru_cache(maxsize=256)
+def _opportunity_template(technology: str) -> Tuple[str, str]:
+    """按技术缓存产业洞察的趋势与机会描述"""
+    return (
+        f"{technology}驱动产业升级",
+        f"{technology}的应用场景拓展"
+    )
+
+
+@lru_cache(maxsize=256)
+def _business_model_template(name: str, value: str) -> Tuple[str, str]:
+    """按创新名称与价值缓存商业模式名称与价值主张"""
+    return (
+        f"{name}商业模式",
+        f"提供{value}"
+    )
 
 
 class IndustryScientist:
@@ -80,9 +229,28 @@ class IndustryScientist:
     def __init__(self, config: Dict = None):
         self.config = config or {}
         self.name = "产业科学家"
-        self.domain = IndustryDomain.TECHNOLOGY
-        self.insights: List[IndustryInsight] = []
+        self.domain = IndustryDomain.TECHNOLOGY  # 经setter同步 _domain_value
+        self._insights = _InsightColumns()
         self.models: List[BusinessModel] = []
+        # 单调递增的ID序列
+        self._insight_seq = itertools.count(1)
+        self._model_seq = itertools.count(1)
+    
+    @property
+    def domain(self) -> IndustryDomain:
+        """产业领域"""
+        return self._domain
+    
+    @domain.setter
+    def domain(self, domain: IndustryDomain):
+        # 领域字符串在赋值时取一次，热路径直接读取
+        self._domain = domain
+        self._domain_value = domain.value
+    
+    @property
+    def insights(self) -> Sequence:
+        """已识别的产业洞察 (列式存储的只读序列视图)"""
+        return self._insights
     
     # ==================== 产业分析 ====================
     
@@ -96,18 +264,10 @@ class IndustryScientist:
             "sector": sector,
             "market_size": "500亿+",
             "growth_rate": "15-20%",
-            "key_players": ["头部企业A", "创新企业B", "跨国集团C"],
-            "technology_trends": ["AI应用", "数字化转型", "绿色技术"],
-            "opportunities": [
-                "技术替代窗口期",
-                "政策红利期",
-                "消费升级需求"
-            ],
-            "threats": [
-                "竞争加剧",
-                "技术迭代快",
-                "监管不确定性"
-            ]
+            "key_players": _INDUSTRY_KEY_PLAYERS,
+            "technology_trends": _INDUSTRY_TRENDS,
+            "opportunities": _INDUSTRY_OPPORTUNITIES,
+            "threats": _INDUSTRY_THREATS
         }
     
     def identify_opportunity(self, technology: str) -> IndustryInsight:
@@ -116,15 +276,16 @@ class IndustryScientist:
         
         从技术角度识别产业机会
         """
+        trend, opportunity = _opportunity_template(technology)
         insight = IndustryInsight(
-            id=f"insight_{hash(technology) % 10000}",
-            domain=self.domain.value,
-            trend=f"{technology}驱动产业升级",
-            opportunity=f"{technology}的应用场景拓展",
+            id=f"insight_{next(self._insight_seq)}",
+            domain=self._domain_value,
+            trend=trend,
+            opportunity=opportunity,
             value_potential=0.85,
             risk_level=0.3
         )
-        self.insights.append(insight)
+        self._insights.append(insight)
         return insight
     
     def assess_value(self, innovation: Dict) -> Dict:
@@ -155,25 +316,17 @@ class IndustryScientist:
         
         为创新设计商业模式
         """
+        name, value_proposition = _business_model_template(
+            innovation.get('name', 'Innovation'),
+            innovation.get('value', '创新价值')
+        )
         model = BusinessModel(
-            id=f"model_{hash(innovation) % 10000}",
-            name=f"{innovation.get('name', 'Innovation')}商业模式",
-            revenue_streams=[
-                "产品销售",
-                "服务订阅",
-                "技术授权"
-            ],
-            cost_structure=[
-                "研发投入",
-                "市场推广",
-                "运营成本"
-            ],
-            key_resources=[
-                "核心技术",
-                "人才团队",
-                "合作伙伴"
-            ],
-            value_proposition=f"提供{innovation.get('value', '创新价值')}"
+            id=f"model_{next(self._model_seq)}",
+            name=name,
+            revenue_streams=_REVENUE_STREAMS,
+            cost_structure=_COST_STRUCTURE,
+            key_resources=_KEY_RESOURCES,
+            value_proposition=value_proposition
         )
         self.models.append(model)
         return model
@@ -187,23 +340,7 @@ class IndustryScientist:
         return {
             "goal": goal,
             "timeline": timeline,
-            "phases": [
-                {
-                    "phase": "第一阶段 (Year 1)",
-                    "focus": "技术验证",
-                    "milestones": ["原型开发", "种子用户", "初步验证"]
-                },
-                {
-                    "phase": "第二阶段 (Year 2)",
-                    "focus": "市场拓展",
-                    "milestones": ["产品迭代", "规模获客", "收入增长"]
-                },
-                {
-                    "phase": "第三阶段 (Year 3)",
-                    "focus": "生态构建",
-                    "milestones": ["行业标准", "生态合作", "IPO/并购"]
-                }
-            ],
+            "phases": _ROADMAP_PHASES,
             "investment_needs": "5000万-1亿",
             "team_size": "50-100人"
         }
@@ -218,18 +355,7 @@ class IndustryScientist:
         """
         return {
             "product": product,
-            "competitors": [
-                {
-                    "name": "竞品A",
-                    "strengths": ["品牌强", "渠道广"],
-                    "weaknesses": ["创新慢", "成本高"]
-                },
-                {
-                    "name": "竞品B",
-                    "strengths": ["技术先进", "价格低"],
-                    "weaknesses": ["服务差", "经验少"]
-                }
-            ],
+            "competitors": _COMPETITORS,
             "market_position": "差异化竞争",
             "advantage_strategy": "技术创新+用户体验"
         }
@@ -242,23 +368,7 @@ class IndustryScientist:
         
         展示多维度的价值创造
         """
-        return {
-            "economic_value": {
-                "revenue_potential": "10亿+",
-                "cost_savings": "20-30%",
-                "efficiency_gain": "50%+"
-            },
-            "social_value": {
-                "job_creation": "100+",
-                "skill_development": "1000+",
-                "community_benefit": "高"
-            },
-            "technological_value": {
-                "innovation_index": "0.82",
-                "ip_potential": "5-10项专利",
-                "knowledge_transfer": "高"
-            }
-        }
+        return dict(_VALUE_MATRIX)
     
     # ==================== 系统状态 ====================
     
@@ -266,17 +376,11 @@ class IndustryScientist:
         """获取状态"""
         return {
             "name": self.name,
-            "domain": self.domain.value,
-            "insights": len(self.insights),
+            "domain": self._domain_value,
+            "insights": len(self._insights),
             "models": len(self.models),
             "status": "active",
-            "capabilities": [
-                "industry_analysis",
-                "opportunity_identification",
-                "value_assessment",
-                "business_design",
-                "roadmap_planning"
-            ]
+            "capabilities": _CAPABILITIES
         }
 
 
@@ -4,9 +4,14 @@ Research Scientist - 科研科学家
 聚焦基础研究、技术突破、科学发现
 """
 
-from typing import Dict, List, Any
-from dataclasses import dataclass
+from typing import Dict, List, Any, Mapping, Tuple
+from dataclasses import dataclass, fields
 from enum import Enum
+from functools import lru_cache
+from operator import attrgetter
+import itertools
+
+from ..._serialization import ReadOnlyDict, dataclass_json
 
 
 class ResearchType(Enum):
@@ -30,7 +35,7 @@ class TRLLevel(Enum):
     TRL9 = "ops_proven"            # 运行验证
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ResearchProject:
     """科研项目"""
     id: str
@@ -42,36 +47,229 @@ class ResearchProject:
     budget_range: str
     
     def to_dict(self) -> Dict:
-        return {
-            "id": self.id,
-            "title": self.title,
-            "type": self.type,
-            "trl_start": self.trl_start,
-            "trl_target": self.trl_target,
-            "duration_months": self.duration_months,
-            "budget_range": self.budget_range
-        }
+        return dict(zip(_RESEARCH_PROJECT_KEYS, _research_project_values(self)))
+    
+    def to_json(self) -> str:
+        return dataclass_json(self)
+
+
+# 序列化字段表：由dataclass字段生成，属性取值器在模块加载时绑定一次
+_RESEARCH_PROJECT_KEYS = tuple(f.name for f in fields(ResearchProject) if f.init)
+_research_project_values = attrgetter(*_RESEARCH_PROJECT_KEYS)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ExperimentDesign:
     """实验设计"""
     id: str
     hypothesis: str
-    variables: Dict
+    variables: Mapping[str, Any]
     methodology: str
     expected_outcome: str
-    success_criteria: List[str]
+    success_criteria: Tuple[str, ...]
     
     def to_dict(self) -> Dict:
-        return {
-            "id": self.id,
-            "hypothesis": self.hypothesis,
-            "variables": self.variables,
-            "methodology": self.methodology,
-            "expected_outcome": self.expected_outcome,
-            "success_criteria": self.success_criteria
-        }
+        return dict(zip(_EXPERIMENT_DESIGN_KEYS, _experiment_design_values(self)))
+    
+    def to_json(self) -> str:
+        return dataclass_json(self)
+
+
+_EXPERIMENT_DESIGN_KEYS = tuple(f.name for f in fields(ExperimentDesign) if f.init)
+_experiment_design_values = attrgetter(*_EXPERIMENT_DESIGN_KEYS)
+
+
+# ==================== 模板常量 ====================
+# 与参数无关的嵌套模板在导入时构建一次，以只读dict共享；方法返回新的外层dict
+
+# 实验设计默认值：只读共享，调用方无法修改模块级默认变量
+_DEFAULT_VARIABLES: Mapping[str, Tuple[str, ...]] = ReadOnlyDict({
+    "independent": ("变量A", "变量B"),
+    "dependent": ("性能指标", "准确率"),
+    "controlled": ("环境参数", "数据质量")
+})
+
+_SUCCESS_CRITERIA = (
+    "p-value < 0.05",
+    "效果量 > 0.5",
+    "可重复性 > 0.9"
+)
+
+_CAPABILITIES = (
+    "research_planning",
+    "experiment_design",
+    "breakthrough_identification",
+    "technology_assessment",
+    "grant_writing"
+)
+
+_ROADMAP_PHASES: Tuple[Mapping[str, Any], ...] = tuple(ReadOnlyDict(d) for d in (
+    {
+        "phase": "Phase 1 (M1-M6)",
+        "trls": ("TRL3", "TRL4"),
+        "focus": "概念验证",
+        "activities": ("理论研究", "算法设计", "仿真验证"),
+        "deliverables": ("技术报告", "原型代码")
+    },
+    {
+        "phase": "Phase 2 (M7-M12)",
+        "trls": ("TRL4", "TRL5"),
+        "focus": "实验室验证",
+        "activities": ("系统集成", "性能测试", "环境验证"),
+        "deliverables": ("实验报告", "专利申请")
+    },
+    {
+        "phase": "Phase 3 (M13-M18)",
+        "trls": ("TRL5", "TRL6"),
+        "focus": "系统演示",
+        "activities": ("原型开发", "场景验证", "用户测试"),
+        "deliverables": ("演示系统", "用户反馈")
+    }
+))
+
+_PIPELINE_STAGES: Tuple[Mapping[str, Any], ...] = tuple(ReadOnlyDict(d) for d in (
+    {
+        "stage": "假设形成",
+        "duration": "1-2周",
+        "activities": ("文献调研", "理论推导", "假设构建")
+    },
+    {
+        "stage": "实验设计",
+        "duration": "2-4周",
+        "activities": ("变量定义", "方法选择", "样本设计")
+    },
+    {
+        "stage": "数据采集",
+        "duration": "4-8周",
+        "activities": ("数据收集", "质量控制", "预处理")
+    },
+    {
+        "stage": "数据分析",
+        "duration": "2-4周",
+        "activities": ("统计分析", "可视化", "结果解释")
+    },
+    {
+        "stage": "结论验证",
+        "duration": "1-2周",
+        "activities": ("敏感性分析", "同行评审", "论文撰写")
+    }
+))
+
+_PIPELINE_CHECKPOINTS = (
+    "数据完整性检查",
+    "分析可重复性验证",
+    "结论稳健性检验"
+)
+
+_BREAKTHROUGH_OPPORTUNITIES: Tuple[Mapping[str, str], ...] = tuple(ReadOnlyDict(d) for d in (
+    {
+        "area": "算法创新",
+        "potential": "高",
+        "difficulty": "高",
+        "timeline": "2-3年",
+        "impact": "颠覆性"
+    },
+    {
+        "area": "系统架构",
+        "potential": "中",
+        "difficulty": "中",
+        "timeline": "1-2年",
+        "impact": "渐进性"
+    },
+    {
+        "area": "应用场景",
+        "potential": "高",
+        "difficulty": "低",
+        "timeline": "6-12月",
+        "impact": "实际价值"
+    }
+))
+
+_RESEARCH_OUTPUT_MATRIX: Mapping[str, Mapping[str, str]] = ReadOnlyDict({
+    "publications": ReadOnlyDict({
+        "target": "年发表量",
+        "q1_papers": "10+",
+        "top_conferences": "5+",
+        "citations": "100+"
+    }),
+    "intellectual_property": ReadOnlyDict({
+        "patents": "10+",
+        "software_copyright": "5+",
+        "technology_standards": "2+"
+    }),
+    "talent_development": ReadOnlyDict({
+        "phd_students": "5+",
+        "postdocs": "3+",
+        "visiting_scholars": "10+"
+    }),
+    "collaboration": ReadOnlyDict({
+        "international": "5+",
+        "industry": "3+",
+        "government": "2+"
+    }),
+    "economic_impact": ReadOnlyDict({
+        "technology_transfer": "2+项目",
+        "startup_incubation": "1-2家",
+        "economic_value": "1亿+"
+    })
+})
+
+_GRANT_SECTIONS: Tuple[Mapping[str, str], ...] = tuple(ReadOnlyDict(d) for d in (
+    {
+        "name": "研究背景与意义",
+        "content": "领域现状、问题提出、科学意义",
+        "weight": "15%"
+    },
+    {
+        "name": "研究目标与内容",
+        "content": "目标体系、研究内容、技术路线",
+        "weight": "25%"
+    },
+    {
+        "name": "研究方案与方法",
+        "content": "关键技术、创新方法、实验设计",
+        "weight": "30%"
+    },
+    {
+        "name": "研究基础与条件",
+        "content": "已有成果、团队优势、平台条件",
+        "weight": "15%"
+    },
+    {
+        "name": "预期成果与考核指标",
+        "content": "成果形式、指标体系、社会效益",
+        "weight": "15%"
+    }
+))
+
+_ROADMAP_MILESTONES = (
+    "M6: 概念验证完成",
+    "M12: 实验室验证完成",
+    "M18: 系统演示完成"
+)
+
+_ROADMAP_RISKS = (
+    "技术难度高",
+    "资源约束",
+    "市场需求变化"
+)
+
+_GRANT_CRITERIA = (
+    "创新性 (30%)",
+    "可行性 (25%)",
+    "科学性 (20%)",
+    "实用性 (15%)",
+    "团队能力 (10%)"
+)
+
+
+# ==================== 模板缓存 ====================
+# 字符串模板为参数的纯函数：按参数缓存格式化结果，重复调用不再拼接
+
+@lru_cache(maxsize=256)
+def _project_title(topic: str) -> str:
+    """按主题缓存科研项目标题"""
+    return f"{topic}研究项目"
 
 
 class ResearchScientist:
@@ -86,6 +284,9 @@ class ResearchScientist:
         self.name = "科研科学家"
         self.projects: List[ResearchProject] = []
         self.experiments: List[ExperimentDesign] = []
+        # 单调递增的ID序列
+        self._project_seq = itertools.count(1)
+        self._experiment_seq = itertools.count(1)
     
     # ==================== 研究规划 ====================
     
@@ -101,8 +302,8 @@ class ResearchScientist:
         制定科研项目规划
         """
         project = ResearchProject(
-            id=f"project_{hash(topic) % 10000}",
-            title=f"{topic}研究项目",
+            id=f"project_{next(self._project_seq)}",
+            title=_project_title(topic),
             type=type,
             trl_start="TRL2",
             trl_target=target_trl,
@@ -122,39 +323,9 @@ class ResearchScientist:
             "goal": goal,
             "current_trl": current_trl,
             "target_trl": "TRL7",
-            "phases": [
-                {
-                    "phase": "Phase 1 (M1-M6)",
-                    "trls": ["TRL3", "TRL4"],
-                    "focus": "概念验证",
-                    "activities": ["理论研究", "算法设计", "仿真验证"],
-                    "deliverables": ["技术报告", "原型代码"]
-                },
-                {
-                    "phase": "Phase 2 (M7-M12)",
-                    "trls": ["TRL4", "TRL5"],
-                    "focus": "实验室验证",
-                    "activities": ["系统集成", "性能测试", "环境验证"],
-                    "deliverables": ["实验报告", "专利申请"]
-                },
-                {
-                    "phase": "Phase 3 (M13-M18)",
-                    "trls": ["TRL5", "TRL6"],
-                    "focus": "系统演示",
-                    "activities": ["原型开发", "场景验证", "用户测试"],
-                    "deliverables": ["演示系统", "用户反馈"]
-                }
-            ],
-            "key_milestones": [
-                "M6: 概念验证完成",
-                "M12: 实验室验证完成", 
-                "M18: 系统演示完成"
-            ],
-            "risk_factors": [
-                "技术难度高",
-                "资源约束",
-                "市场需求变化"
-            ]
+            "phases": _ROADMAP_PHASES,
+            "key_milestones": _ROADMAP_MILESTONES,
+            "risk_factors": _ROADMAP_RISKS
         }
     
     # ==================== 实验设计 ====================
@@ -162,7 +333,7 @@ class ResearchScientist:
     def design_experiment(
         self, 
         hypothesis: str,
-        variables: Dict = None
+        variables: Mapping[str, Any] = None
     ) -> ExperimentDesign:
         """
         实验设计
@@ -170,20 +341,12 @@ class ResearchScientist:
         设计科学实验
         """
         design = ExperimentDesign(
-            id=f"exp_{hash(hypothesis) % 10000}",
+            id=f"exp_{next(self._experiment_seq)}",
             hypothesis=hypothesis,
-            variables=variables or {
-                "independent": ["变量A", "变量B"],
-                "dependent": ["性能指标", "准确率"],
-                "controlled": ["环境参数", "数据质量"]
-            },
+            variables=variables or _DEFAULT_VARIABLES,
             methodology="控制实验 + 统计分析",
             expected_outcome="验证假设，支持理论发展",
-            success_criteria=[
-                "p-value < 0.05",
-                "效果量 > 0.5",
-                "可重复性 > 0.9"
-            ]
+            success_criteria=_SUCCESS_CRITERIA
         )
         self.experiments.append(design)
         return design
@@ -196,39 +359,9 @@ class ResearchScientist:
         """
         return {
             "project_id": project_id,
-            "pipeline_stages": [
-                {
-                    "stage": "假设形成",
-                    "duration": "1-2周",
-                    "activities": ["文献调研", "理论推导", "假设构建"]
-                },
-                {
-                    "stage": "实验设计",
-                    "duration": "2-4周",
-                    "activities": ["变量定义", "方法选择", "样本设计"]
-                },
-                {
-                    "stage": "数据采集",
-                    "duration": "4-8周",
-                    "activities": ["数据收集", "质量控制", "预处理"]
-                },
-                {
-                    "stage": "数据分析",
-                    "duration": "2-4周",
-                    "activities": ["统计分析", "可视化", "结果解释"]
-                },
-                {
-                    "stage": "结论验证",
-                    "duration": "1-2周",
-                    "activities": ["敏感性分析", "同行评审", "论文撰写"]
-                }
-            ],
+            "pipeline_stages": _PIPELINE_STAGES,
             "total_duration": "10-20周",
-            "quality_checkpoints": [
-                "数据完整性检查",
-                "分析可重复性验证",
-                "结论稳健性检验"
-            ]
+            "quality_checkpoints": _PIPELINE_CHECKPOINTS
         }
     
     # ==================== 技术突破 ====================
@@ -241,29 +374,7 @@ class ResearchScientist:
         """
         return {
             "field": field,
-            "breakthrough_opportunities": [
-                {
-                    "area": "算法创新",
-                    "potential": "高",
-                    "difficulty": "高",
-                    "timeline": "2-3年",
-                    "impact": "颠覆性"
-                },
-                {
-                    "area": "系统架构",
-                    "potential": "中",
-                    "difficulty": "中",
-                    "timeline": "1-2年",
-                    "impact": "渐进性"
-                },
-                {
-                    "area": "应用场景",
-                    "potential": "高",
-                    "difficulty": "低",
-                    "timeline": "6-12月",
-                    "impact": "实际价值"
-                }
-            ],
+            "breakthrough_opportunities": _BREAKTHROUGH_OPPORTUNITIES,
             "recommended_focus": "算法创新 + 应用场景结合",
             "rationale": "平衡创新性与落地性"
         }
@@ -305,34 +416,7 @@ class ResearchScientist:
         
         多维度科研成果评估
         """
-        return {
-            "publications": {
-                "target": "年发表量",
-                "q1_papers": "10+",
-                "top_conferences": "5+",
-                "citations": "100+"
-            },
-            "intellectual_property": {
-                "patents": "10+",
-                "software_copyright": "5+",
-                "technology_standards": "2+"
-            },
-            "talent_development": {
-                "phd_students": "5+",
-                "postdocs": "3+",
-                "visiting_scholars": "10+"
-            },
-            "collaboration": {
-                "international": "5+",
-                "industry": "3+",
-                "government": "2+"
-            },
-            "economic_impact": {
-                "technology_transfer": "2+项目",
-                "startup_incubation": "1-2家",
-                "economic_value": "1亿+"
-            }
-        }
+        return dict(_RESEARCH_OUTPUT_MATRIX)
     
     def grant_proposal(self, topic: str, funding_amount: str = "500万") -> Dict:
         """
@@ -343,40 +427,8 @@ class ResearchScientist:
         return {
             "topic": topic,
             "funding_amount": funding_amount,
-            "sections": [
-                {
-                    "name": "研究背景与意义",
-                    "content": "领域现状、问题提出、科学意义",
-                    "weight": "15%"
-                },
-                {
-                    "name": "研究目标与内容",
-                    "content": "目标体系、研究内容、技术路线",
-                    "weight": "25%"
-                },
-                {
-                    "name": "研究方案与方法",
-                    "content": "关键技术、创新方法、实验设计",
-                    "weight": "30%"
-                },
-                {
-                    "name": "研究基础与条件",
-                    "content": "已有成果、团队优势、平台条件",
-                    "weight": "15%"
-                },
-                {
-                    "name": "预期成果与考核指标",
-                    "content": "成果形式、指标体系、社会效益",
-                    "weight": "15%"
-                }
-            ],
-            "evaluation_criteria": [
-                "创新性 (30%)",
-                "可行性 (25%)",
-                "科学性 (20%)",
-                "实用性 (15%)",
-                "团队能力 (10%)"
-            ],
+            "sections": _GRANT_SECTIONS,
+            "evaluation_criteria": _GRANT_CRITERIA,
             "submission_deadline": "通常为每年3月/9月"
         }
     
@@ -389,13 +441,7 @@ class ResearchScientist:
             "projects": len(self.projects),
             "experiments": len(self.experiments),
             "status": "active",
-            "capabilities": [
-                "research_planning",
-                "experiment_design",
-                "breakthrough_identification",
-                "technology_assessment",
-                "grant_writing"
-            ]
+            "capabilities": _CAPABILITIES
         }
 
 
@@ -422,7 +468,7 @@ if __name__ == "__main__":
     print("\n🗺️ 技术路线图:")
     roadmap = scientist.roadmap("AGI实现")
     print(f"   目标: {roadmap['goal']}")
-    print(f"   当前: {roadroad['current_trl']} -> 目标: {roadmap['target_trl']}")
+    print(f"   当前: {roadmap['current_trl']} -> 目标: {roadmap['target_trl']}")
     print(f"   阶段数: {len(roadmap['phases'])}")
     
     print("\n🔬 实验设计:")
@@ -5,10 +5,12 @@ Suboya AI Scientist Core
 整合古典智慧与AI能力的数字科学家
 """
 
-from typing import Dict, List, Any
-from dataclasses import dataclass
+from typing import Dict, List, Any, Tuple
+from dataclasses import dataclass, fields
 from enum import Enum
 from datetime import datetime
+from operator import attrgetter
+from types import MappingProxyType
 
 
 class WisdomMode(Enum):
@@ -19,25 +21,59 @@ class WisdomMode(Enum):
     INTEGRATED = "integrated"   # 综合模式
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ScientistProfile:
-    """科学家档案"""
+    """科学家档案 (不可变：更新档案时整体替换实例)"""
     id: str
     name: str
-    specialties: List[str]
-    achievements: List[str]
+    specialties: Tuple[str, ...]
+    achievements: Tuple[str, ...]
     publications: int
     citations: int
     
     def to_dict(self) -> Dict:
-        return {
-            "id": self.id,
-            "name": self.name,
-            "specialties": self.specialties,
-            "achievements": self.achievements,
-            "publications": self.publications,
-            "citations": self.citations
-        }
+        return dict(zip(_SCIENTIST_PROFILE_KEYS, _scientist_profile_values(self)))
+
+
+# 序列化字段表：由dataclass字段生成，属性取值器在模块加载时绑定一次
+_SCIENTIST_PROFILE_KEYS = tuple(f.name for f in fields(ScientistProfile) if f.init)
+_scientist_profile_values = attrgetter(*_SCIENTIST_PROFILE_KEYS)
+
+
+# ==================== 能力清单常量 ====================
+# 与实例无关，导入时构建一次
+
+_CORE_ABILITIES = (
+    "科学研究",
+    "批判分析",
+    "真善美评估",
+    "知识管理",
+    "智慧对话"
+)
+
+_WISDOM_MODE_VALUES = tuple(m.value for m in WisdomMode)
+
+_AI_CAPABILITIES = (
+    "自然语言理解",
+    "知识推理",
+    "代码生成",
+    "科学研究",
+    "创新思维"
+)
+
+_SCIENTIST_VIRTUES = MappingProxyType({
+    "truth": "批判理性",
+    "goodness": "伦理合规",
+    "beauty": "整合创新"
+})
+
+# 对话角色表：role → (人设, 方法, 响应模板)；仅响应依赖话题
+_ROLE_TABLE = MappingProxyType({
+    "socratic": ("苏格拉底 - 追问者", "通过提问引导思考", "关于{topic}，让我们来问几个问题..."),
+    "platonic": ("柏拉图 - 理想主义者", "超越现象，洞见本质", "{topic}的形式是什么？让我们超越表象..."),
+    "aristotelian": ("亚里士多德 - 分析者", "逻辑推理，中庸之道", "分析{topic}，我们需要考虑适度原则..."),
+    "integrated": ("苏柏亚 - 整合者", "综合三方智慧", "关于{topic}，让我从三个角度来分析...")
+})
 
 
 class SuboyaAIScientist:
@@ -57,12 +93,12 @@ class SuboyaAIScientist:
         self.profile = ScientistProfile(
             id="suboya_001",
             name="苏柏亚",
-            specialties=["AI研究", "古典智慧", "跨学科融合"],
-            achievements=[
+            specialties=("AI研究", "古典智慧", "跨学科融合"),
+            achievements=(
                 "构建数字科学家框架",
                 "整合批判理性主义",
                 "提出知识胶囊系统"
-            ],
+            ),
             publications=10,
             citations=500
         )
@@ -240,36 +276,13 @@ class SuboyaAIScientist:
         
         以不同哲学家的方式讨论话题
         """
-        roles = {
-            "socratic": {
-                "persona": "苏格拉底 - 追问者",
-                "approach": "通过提问引导思考",
-                "response": f"关于{topic}，让我们来问几个问题..."
-            },
-            "platonic": {
-                "persona": "柏拉图 - 理想主义者",
-                "approach": "超越现象，洞见本质",
-                "response": f"{topic}的形式是什么？让我们超越表象..."
-            },
-            "aristotelian": {
-                "persona": "亚里士多德 - 分析者",
-                "approach": "逻辑推理，中庸之道",
-                "response": f"分析{topic}，我们需要考虑适度原则..."
-            },
-            "integrated": {
-                "persona": "苏柏亚 - 整合者",
-                "approach": "综合三方智慧",
-                "response": f"关于{topic}，让我从三个角度来分析..."
-            }
-        }
-        
-        selected = roles.get(role, roles["integrated"])
+        persona, approach, template = _ROLE_TABLE.get(role, _ROLE_TABLE["integrated"])
         
         return {
             "topic": topic,
-            "role": selected["persona"],
-            "approach": selected["approach"],
-            "response": selected["response"],
+            "role": persona,
+            "approach": approach,
+            "response": template.format(topic=topic),
             "dialogue_history": []
         }
     
@@ -279,26 +292,10 @@ class SuboyaAIScientist:
         """获取能力清单"""
         return {
             "name": self.name,
-            "core_abilities": [
-                "科学研究",
-                "批判分析",
-                "真善美评估",
-                "知识管理",
-                "智慧对话"
-            ],
-            "wisdom_modes": [m.value for m in WisdomMode],
-            "ai_capabilities": [
-                "自然语言理解",
-                "知识推理",
-                "代码生成",
-                "科学研究",
-                "创新思维"
-            ],
-            "scientist素养": {
-                "truth": "批判理性",
-                "goodness": "伦理合规",
-                "beauty": "整合创新"
-            }
+            "core_abilities": _CORE_ABILITIES,
+            "wisdom_modes": _WISDOM_MODE_VALUES,
+            "ai_capabilities": _AI_CAPABILITIES,
+            "scientist素养": dict(_SCIENTIST_VIRTUES)
         }
     
     def get_status(self) -> Dict:
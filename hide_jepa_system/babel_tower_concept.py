@@ -25,7 +25,7 @@ class IntelligenceType:
     PHYSICAL = "physical"            # 身体运动智能
 
 
-@dataclass
+@dataclass(slots=True)
 class BabelCapsule:
     """巴别塔知识胶囊"""
     capsule_id: str